@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+#--------------------------------------------------------------------------------
+# Benchmark the ECDF normaliser against the original sort-per-sample
+# implementation, at a range of history sizes.
+#
+# Usage: python3 benchmarks/ecdf.py [--samples N]
+#--------------------------------------------------------------------------------
+
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, ".")
+from dataplex.processors.normalise.ecdf import ecdf, ProcessorECDFNormalise
+
+def process_original(history, value, max_history_size):
+    normalized = ecdf(history, value)
+    history.append(value)
+    while len(history) > max_history_size:
+        history.pop(0)
+    return normalized
+
+def main(args):
+    print("%-10s %-16s %-16s %-10s" % ("history", "original (us)", "incremental (us)", "speedup"))
+    for history_size in [1000, 10000, 100000]:
+        values = [random.gauss(0, 1) for _ in range(history_size)]
+        samples = [random.gauss(0, 1) for _ in range(args.samples)]
+
+        #--------------------------------------------------------------------------------
+        # Fill both normalisers to capacity, so that every sample also evicts a value.
+        #--------------------------------------------------------------------------------
+        history = list(values)
+        processor = ProcessorECDFNormalise(max_history_size=history_size)
+        for value in values:
+            processor.distribution.add(value)
+
+        t0 = time.perf_counter()
+        original = [process_original(history, sample, history_size) for sample in samples]
+        original_duration = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        incremental = [processor.process(sample) for sample in samples]
+        incremental_duration = time.perf_counter() - t0
+
+        assert original == incremental, "Outputs differ"
+
+        original_us = original_duration / len(samples) * 1e6
+        incremental_us = incremental_duration / len(samples) * 1e6
+        print("%-10d %-16.1f %-16.1f %.0fx" % (history_size, original_us, incremental_us, original_us / incremental_us))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=200, help="Number of samples to process at each history size")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+#--------------------------------------------------------------------------------
+# Benchmark FrameSerialiser against serialise_data(), for frames of a range of
+# sizes. "uncached" serialises each frame once, as a plain dict, measuring the
+# per-call cost only. "cached" serialises each frame once per JSON-based
+# destination, as a Frame with a new tick, so that every destination after the
+# first hits the per-tick cache.
+#
+# Usage: python3 benchmarks/serialise.py [--frames N] [--destinations N]
+#--------------------------------------------------------------------------------
+
+import sys
+import time
+import random
+import datetime
+import argparse
+
+sys.path.insert(0, ".")
+from dataplex.utils import serialise_data, FrameSerialiser
+from dataplex.frame import Frame
+
+def generate_frames(property_count: int, frame_count: int) -> list[dict]:
+    start_time = datetime.datetime.now()
+    frames = []
+    for index in range(frame_count):
+        frame = {"time": start_time + datetime.timedelta(seconds=index)}
+        for property_index in range(property_count):
+            frame["property_%d" % property_index] = random.random()
+        frames.append(frame)
+    return frames
+
+def main(args):
+    print("%-12s %-16s %-16s %-10s %-16s %-10s" % ("properties", "original (us)", "uncached (us)", "speedup",
+                                                    "cached (us)", "speedup"))
+    for property_count in [5, 50, 500]:
+        frames = generate_frames(property_count, args.frames)
+
+        t0 = time.perf_counter()
+        for frame in frames:
+            for _ in range(args.destinations):
+                original = serialise_data(frame)
+        original_duration = time.perf_counter() - t0
+
+        serialiser = FrameSerialiser()
+        t0 = time.perf_counter()
+        for frame in frames:
+            for _ in range(args.destinations):
+                serialised = serialiser.serialise(frame)
+        uncached_duration = time.perf_counter() - t0
+
+        assert original == serialised, "Outputs differ"
+
+        serialiser = FrameSerialiser()
+        ticked_frames = []
+        for frame in frames:
+            ticked_frame = Frame()
+            ticked_frame.update(frame)
+            ticked_frame.next_tick()
+            ticked_frames.append(ticked_frame)
+
+        t0 = time.perf_counter()
+        for frame in ticked_frames:
+            for _ in range(args.destinations):
+                serialised = serialiser.serialise(frame)
+        cached_duration = time.perf_counter() - t0
+
+        assert original == serialised, "Outputs differ"
+
+        original_us = original_duration / len(frames) * 1e6
+        uncached_us = uncached_duration / len(frames) * 1e6
+        cached_us = cached_duration / len(frames) * 1e6
+        print("%-12d %-16.1f %-16.1f %-10s %-16.1f %-10s" % (property_count, original_us,
+                                                            uncached_us, "%.1fx" % (original_us / uncached_us),
+                                                            cached_us, "%.1fx" % (original_us / cached_us)))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=2000, help="Number of frames to serialise at each size")
+    parser.add_argument("--destinations", type=int, default=2, help="Number of destinations serialising each frame")
+    args = parser.parse_args()
+    main(args)
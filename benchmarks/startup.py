@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+#--------------------------------------------------------------------------------
+# Benchmark dataplex startup time and memory, importing only the sources and
+# destinations used by a minimal config (ultimeter + stdout), versus importing
+# every source and destination. Each case is run in a fresh interpreter.
+#
+# Usage: python3 benchmarks/startup.py [--runs N]
+#--------------------------------------------------------------------------------
+
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+MINIMAL = """
+from dataplex import Dataplex
+Dataplex.SOURCE_CLASS_MAP["ultimeter"]
+Dataplex.DESTINATION_CLASS_MAP["stdout"]
+"""
+
+ALL = """
+from dataplex import Dataplex
+for class_map in [Dataplex.SOURCE_CLASS_MAP, Dataplex.DESTINATION_CLASS_MAP]:
+    for name in class_map:
+        try:
+            class_map[name]
+        except ImportError:
+            pass
+"""
+
+#--------------------------------------------------------------------------------
+# Run in the child process: report wall time and peak RSS (in KB on Linux).
+#--------------------------------------------------------------------------------
+HARNESS = """
+import time, json, resource
+t0 = time.perf_counter()
+exec(%r)
+duration = time.perf_counter() - t0
+print(json.dumps({"duration": duration, "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+def measure(code: str) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", HARNESS % code], cwd=".")
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+def main(args):
+    print("%-10s %-16s %-16s" % ("imports", "time (ms)", "peak RSS (MB)"))
+    for name, code in [("minimal", MINIMAL), ("all", ALL)]:
+        results = [measure(code) for _ in range(args.runs)]
+        duration = statistics.median(result["duration"] for result in results)
+        rss = statistics.median(result["rss"] for result in results)
+        print("%-10s %-16.1f %-16.1f" % (name, duration * 1000, rss / 1024))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs of each case")
+    args = parser.parse_args()
+    main(args)
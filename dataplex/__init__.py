@@ -1,3 +1,19 @@
 from .dataplex import Dataplex
-from .sources import SourceAudio, SourceCSV, SourcePakbus, SourceUltimeter, SourceWebcam, SourceJDP, SourceSerial, SourceOSC
-from .destinations import DestinationOSC, DestinationJDP, DestinationCSV, DestinationStdout, DestinationMidi, DestinationScope
\ No newline at end of file
+from .registry import lazy_module_getattr, register_source, register_destination, register_processor
+
+__getattr__ = lazy_module_getattr(__name__, {
+    "SourceAudio": ".sources",
+    "SourceCSV": ".sources",
+    "SourcePakbus": ".sources",
+    "SourceUltimeter": ".sources",
+    "SourceWebcam": ".sources",
+    "SourceJDP": ".sources",
+    "SourceSerial": ".sources",
+    "SourceOSC": ".sources",
+    "DestinationOSC": ".destinations",
+    "DestinationJDP": ".destinations",
+    "DestinationCSV": ".destinations",
+    "DestinationStdout": ".destinations",
+    "DestinationMidi": ".destinations",
+    "DestinationScope": ".destinations"
+})
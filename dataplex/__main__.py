@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import argparse
 
@@ -9,6 +10,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser("Run the dataplex I/O server")
     parser.add_argument("--verbose", "-v", help="Verbose output", action="store_true")
     parser.add_argument("--quiet", "-q", help="Quiet output", action="store_true")
+    parser.add_argument("--async", dest="use_async", help="Run using the asyncio engine", action="store_true")
     parser.add_argument("-c", "--config-file", type=str, help="Path to JSON config file", default="config/config.json")
     args = parser.parse_args()
 
@@ -20,4 +22,7 @@ if __name__ == "__main__":
     logging.basicConfig(level=log_level, format='%(asctime)s %(name)-24s %(levelname)-8s %(message)s')
 
     server = Dataplex(config_file=args.config_file)
-    server.run()
+    if args.use_async:
+        asyncio.run(server.run_async())
+    else:
+        server.run()
@@ -1,27 +1,57 @@
 import sys
-import copy
 import numpy as np
 
+#--------------------------------------------------------------
+# The initial number of records allocated per column. Storage
+# grows by doubling until it can hold max_size records.
+#--------------------------------------------------------------
+INITIAL_CAPACITY = 1024
+
+def get_missing_value(name: str, column: np.ndarray):
+    """
+    Returns:
+        The value used to mark a missing entry in the given column.
+    """
+    if name == "time":
+        return np.datetime64("NaT")
+    elif column.dtype == object:
+        return None
+    return np.nan
+
 class RollingFeatureBufferSlice:
-    def __init__(self, buffer: list):
+    def __init__(self, columns: dict):
         """
         Initialise the RollingFeatureBufferSlice.
 
         Args:
-            buffer: The list of dicts to provide as a slice.
+            columns: A dict of NumPy arrays to provide as a slice, keyed by property name.
         """
-        self.buffer = buffer
-    
-    def __getattribute__(self, name):
-        if name == "buffer":
-            return object.__getattribute__(self, name)
-        else:
-            return np.array([record.get(name).value for record in self.buffer])
-    
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["time"])
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError("Property not found in buffer: %s" % name)
+
 class RollingFeatureBuffer:
     """
     Encapsulates a rolling buffer of feature dicts, in which each entry is automatically
     added on each dataplex record.
+
+    Records are stored in columnar form, with one preallocated float64 array per property,
+    plus a datetime64 array for the time of each record. Properties whose first value is
+    not numeric (e.g. strings, or dicts from JSON-decoded records) are stored in an object
+    array instead, with None for missing values. Non-numeric values of numeric properties
+    are stored as NaN. Appending is amortised O(1), and
+    property accessors (e.g. buffer.temperature, buffer[-100:].wind_speed) return
+    zero-copy views onto the underlying storage.
+
+    Note that views are only valid until the next append, after which their contents
+    may be overwritten. Use .copy() to retain values.
     """
 
     def __init__(self, max_size: int = sys.maxsize):
@@ -32,8 +62,8 @@ class RollingFeatureBuffer:
             max_size: The maximum size of the buffer.
         """
         self.max_size = max_size
-        self.buffer = []
-    
+        self.reset()
+
     def __len__(self) -> int:
         """
         Get the current size of the buffer.
@@ -41,26 +71,46 @@ class RollingFeatureBuffer:
         Returns:
             The current size of the buffer.
         """
-        return len(self.buffer)
+        return self.end - self.start
 
-    def __getitem__(self, key: slice) -> RollingFeatureBufferSlice:
+    def __getitem__(self, key):
         """
         Get a slice of the buffer as a RollingFeatureBufferSlice.
 
         Args:
-            key: The slice object specifying the range.
+            key: The slice object specifying the range. If an integer index is given,
+                 the corresponding record is returned as a dict.
 
         Returns:
             A RollingFeatureBufferSlice containing the sliced buffer.
         """
-        return RollingFeatureBufferSlice(self.buffer[key])
-
-    def __getattribute__(self, name):
-        if name in ["buffer", "max_size", "append", "reset"] or name.startswith("_"):
-            return object.__getattribute__(self, name)
+        columns = self.columns
+        if isinstance(key, slice):
+            return RollingFeatureBufferSlice(dict((name, column[key]) for name, column in columns.items()))
         else:
-            return getattr(RollingFeatureBufferSlice(self.buffer), name)
-    
+            return dict((name, column[key] if column.dtype == object else column[key].item())
+                        for name, column in columns.items())
+
+    def __getattr__(self, name):
+        if name.startswith("_") or "storage" not in self.__dict__:
+            raise AttributeError(name)
+        try:
+            return self.storage[name][self.start:self.end]
+        except KeyError:
+            raise AttributeError("Property not found in buffer: %s" % name)
+
+    @property
+    def columns(self) -> dict:
+        """
+        Returns:
+            dict: Views onto the current contents of each column, keyed by property name.
+        """
+        return dict((name, storage[self.start:self.end]) for name, storage in self.storage.items())
+
+    @property
+    def property_names(self) -> list[str]:
+        return [name for name in self.storage.keys() if name != "time"]
+
     def append(self, record: dict) -> None:
         """
         Append a new record to the buffer.
@@ -68,13 +118,80 @@ class RollingFeatureBuffer:
         Args:
             record: The record to append.
         """
-        self.buffer.append(copy.deepcopy(record))
-        if len(self.buffer) > self.max_size:
-            self.buffer.pop(0)
-    
+        if self.end == self.capacity:
+            self._reserve()
+
+        index = self.end
+        for name, value in record.items():
+            #--------------------------------------------------------------
+            # Records with a .value (e.g. ECDF-normalised records) are
+            # stored by their value.
+            #--------------------------------------------------------------
+            if name != "time":
+                value = getattr(value, "value", value)
+            if name not in self.storage:
+                self._add_column(name, value)
+            column = self.storage[name]
+            if name == "time":
+                column[index] = value if value is not None else np.datetime64("NaT")
+            elif column.dtype == object:
+                column[index] = value
+            elif value is None:
+                column[index] = np.nan
+            else:
+                try:
+                    column[index] = value
+                except (TypeError, ValueError):
+                    column[index] = np.nan
+
+        #--------------------------------------------------------------
+        # Properties that are absent from this record are marked as
+        # missing.
+        #--------------------------------------------------------------
+        if len(record) < len(self.storage):
+            for name, storage in self.storage.items():
+                if name not in record:
+                    storage[index] = get_missing_value(name, storage)
+
+        self.end += 1
+        if self.end - self.start > self.max_size:
+            self.start += 1
+
     def reset(self) -> None:
         """
         Remove all entries from the buffer.
         """
-        self.buffer = []
+        self.capacity = min(INITIAL_CAPACITY, 2 * self.max_size)
+        self.start = 0
+        self.end = 0
+        self.storage = {}
+        self._add_column("time")
+
+    def _add_column(self, name: str, value=None) -> None:
+        if name == "time":
+            column = np.full(self.capacity, np.datetime64("NaT"), dtype="datetime64[us]")
+        elif value is None or isinstance(value, (int, float, np.number)):
+            column = np.full(self.capacity, np.nan, dtype=np.float64)
+        else:
+            column = np.full(self.capacity, None, dtype=object)
+        self.storage[name] = column
 
+    def _reserve(self) -> None:
+        """
+        Called when the end of storage is reached. If the buffer occupies no more than half
+        of its storage, its contents are moved to the start of storage; otherwise, storage
+        is doubled in size. Either way, at least as many appends as records moved occur
+        before the next call, so appends are amortised O(1).
+        """
+        size = self.end - self.start
+        if size * 2 > self.capacity:
+            self.capacity = min(2 * self.capacity, 2 * self.max_size)
+            for name, storage in self.storage.items():
+                resized = np.empty(self.capacity, dtype=storage.dtype)
+                resized[:size] = storage[self.start:self.end]
+                self.storage[name] = resized
+        else:
+            for storage in self.storage.values():
+                storage[:size] = storage[self.start:self.end]
+        self.start = 0
+        self.end = size
@@ -3,11 +3,13 @@
 #--------------------------------------------------------------------------------
 
 from typing import Optional, Union, Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 import json
 import yaml
 import os
 
+from . import registry
+
 #--------------------------------------------------------------------------------
 # Sources
 #--------------------------------------------------------------------------------
@@ -17,6 +19,19 @@ class SourceConfig(BaseModel):
     enabled: Optional[bool] = True
     properties: Optional[Union[list[str], list[dict]]] = []
 
+    #--------------------------------------------------------------------------------
+    # Override the general stale_after and stale_policy settings for this source.
+    #--------------------------------------------------------------------------------
+    stale_after: Optional[float] = None
+    stale_policy: Optional[Literal['hold', 'null', 'interpolate']] = None
+
+#--------------------------------------------------------------------------------
+# Used for plugin sources that do not declare a config model: any additional
+# fields are passed to the source's constructor.
+#--------------------------------------------------------------------------------
+class GenericSourceConfig(SourceConfig):
+    model_config = ConfigDict(extra='allow')
+
 class UltimeterSourceConfig(SourceConfig):
     type: Literal['ultimeter']
     port: Optional[str] = None
@@ -34,6 +49,20 @@ class CSVSourceConfig(SourceConfig):
     type: Literal['csv']
     path: str
     rate: Optional[float] = 1.0
+    realtime: Optional[bool] = True
+    chunk_size: Optional[int] = 10000
+    start_at: Optional[str] = None
+
+class NPYSourceConfig(SourceConfig):
+    type: Literal['npy']
+    path: str
+    rate: Optional[float] = 1.0
+    realtime: Optional[bool] = True
+    start_at: Optional[str] = None
+
+class OSCSourceConfig(SourceConfig):
+    type: Literal['osc']
+    port: Optional[int] = 8000
 
 class JDPSourceConfig(SourceConfig):
     type: Literal['jdp']
@@ -53,66 +82,165 @@ class VideoSourceConfig(SourceConfig):
 #--------------------------------------------------------------------------------
 # Destinations
 #--------------------------------------------------------------------------------
+class QueueConfig(BaseModel):
+    policy: Literal['block', 'drop_oldest', 'coalesce'] = 'block'
+    max_size: int = 16
+
+#--------------------------------------------------------------------------------
+# delta enables delta-only publishing for network destinations (osc, jdp, zmq,
+# scope): only properties whose values change by more than epsilon are sent,
+# plus a full-state keyframe every keyframe_interval seconds.
+#--------------------------------------------------------------------------------
+class DeltaConfig(BaseModel):
+    epsilon: Union[float, dict[str, float]] = 0.0
+    keyframe_interval: float = 5.0
+
 class DestinationConfig(BaseModel):
     type: str
+    queue: Optional[QueueConfig] = None
+
+class GenericDestinationConfig(DestinationConfig):
+    model_config = ConfigDict(extra='allow')
 
-class OSCDestinationConfig(BaseModel):
+class OSCDestinationConfig(DestinationConfig):
     type: Literal['osc']
     host: str
     port: int
     prefix: str = "/data/"
+    bundle: bool = False
+    mtu: int = 1472
+    delta: Optional[DeltaConfig] = None
 
-class JDPDestinationConfig(BaseModel):
+class JDPDestinationConfig(DestinationConfig):
     type: Literal['jdp']
     host: str
     port: int
+    delta: Optional[DeltaConfig] = None
 
-class CSVDestinationConfig(BaseModel):
+class CSVDestinationConfig(DestinationConfig):
     type: Literal['csv']
     path: str
+    flush_rows: int = 100
+    flush_interval: float = 1.0
+    fsync: bool = False
+    rotate_interval: Optional[float] = None
+    rotate_size: Optional[int] = None
+
+class NPYDestinationConfig(DestinationConfig):
+    type: Literal['npy']
+    path: str
+    row_group_size: int = 10000
+    dtype: Literal['float64', 'float32'] = 'float64'
+    flush_interval: Optional[float] = 10.0
+
+class SharedMemoryDestinationConfig(DestinationConfig):
+    type: Literal['shm']
+    name: str = "dataplex"
+    ring_size: int = 1
 
-class ZMQDestinationConfig(BaseModel):
+class ZMQDestinationConfig(DestinationConfig):
     type: Literal['zmq']
+    encoding: Literal['json', 'msgpack', 'struct'] = 'json'
+    delta: Optional[DeltaConfig] = None
 
-class StdoutDestinationConfig(BaseModel):
+class StdoutDestinationConfig(DestinationConfig):
     type: Literal['stdout']
 
-class ScopeDestinationConfig(BaseModel):
+class ScopeDestinationConfig(DestinationConfig):
     type: Literal['scope']
+    delta: Optional[DeltaConfig] = None
 
 #--------------------------------------------------------------------------------
-# Union types for sources and destinations
+# Top-level config
 #--------------------------------------------------------------------------------
 
-SourceUnion = Union[AudioSourceConfig,
-                    VideoSourceConfig,
-                    SerialSourceConfig,
-                    CSVSourceConfig,
-                    JDPSourceConfig,
-                    PakbusSourceConfig,
-                    UltimeterSourceConfig,
-                    ZMQSourceConfig]
-
-DestinationUnion = Union[OSCDestinationConfig,
-                         CSVDestinationConfig,
-                         JDPDestinationConfig,
-                         StdoutDestinationConfig,
-                         ScopeDestinationConfig,
-                         ZMQDestinationConfig]
-
 #--------------------------------------------------------------------------------
-# Top-level config
+# Resampling of properties onto the shared clock, for sources that arrive at
+# different rates. Settings can be overridden per property, with a "resample"
+# dict of mode, window and decimate.
 #--------------------------------------------------------------------------------
+class ResampleConfig(BaseModel):
+    mode: Literal['hold', 'linear', 'mean'] = 'hold'
+    window: Optional[float] = None
+    delay: float = 0.0
+    history_size: int = 256
 
 class GeneralConfig(BaseModel):
     read_interval: Optional[float] = 0.25
 
-from pydantic import Field
+    #--------------------------------------------------------------------------------
+    # scheduler selects how the main loop is paced:
+    #  - interval: sleep for read_interval between each read
+    #  - event: wake as soon as a push-style source signals new data, reading
+    #           at most max_rate times per second, and at least once every
+    #           heartbeat_interval seconds
+    #--------------------------------------------------------------------------------
+    scheduler: Literal['interval', 'event'] = 'interval'
+    max_rate: Optional[float] = None
+    heartbeat_interval: Optional[float] = 1.0
+
+    #--------------------------------------------------------------------------------
+    # A property is stale if no new sample has arrived from its source for
+    # stale_after seconds (by default, staleness is not tracked). stale_policy
+    # selects how stale values are treated in realtime:
+    #  - hold: keep the last value
+    #  - null: set the value to NaN, marking it as missing
+    #  - interpolate: extrapolate linearly from the last two samples, for up to
+    #                 stale_after seconds, and then hold
+    #--------------------------------------------------------------------------------
+    stale_after: Optional[float] = None
+    stale_policy: Literal['hold', 'null', 'interpolate'] = 'hold'
+
+    resample: Optional[ResampleConfig] = None
+
+#--------------------------------------------------------------------------------
+# Threshold events, triggered when a property crosses a threshold, and passed
+# to each destination (e.g. payload {"note": 60} to play a MIDI note).
+#--------------------------------------------------------------------------------
+class EventConfig(BaseModel):
+    property: str
+    threshold: float
+    direction: Literal['up', 'down', 'both'] = 'both'
+    hysteresis: float = 0.0
+    debounce_time: float = 0.0
+    payload: Optional[dict] = None
+
+def parse_component_config(component_registry: registry.ComponentRegistry,
+                           config,
+                           default_config_class: type,
+                           kind: str) -> BaseModel:
+    """
+    Validate a source or destination config against the model bound to its type in the registry.
+    """
+    if isinstance(config, BaseModel):
+        return config
+    component_type = config.get("type")
+    if component_type not in component_registry:
+        raise ValueError("%s type not known: %s" % (kind, component_type))
+    config_class = component_registry.get_config_class(component_type, default_config_class)
+    return config_class(**config)
 
 class Config(BaseModel):
     config: GeneralConfig = GeneralConfig()
-    sources: list[SourceUnion] = Field(default_factory=list, discriminator='type')
-    destinations: list[DestinationUnion] = []
+    sources: list[SourceConfig] = []
+    destinations: list[DestinationConfig] = []
+    events: list[EventConfig] = []
+
+    #--------------------------------------------------------------------------------
+    # Sources and destinations are validated against the config model registered
+    # for their type, so that plugins can define their own config fields.
+    #--------------------------------------------------------------------------------
+    @field_validator('sources', mode='before')
+    @classmethod
+    def validate_sources(cls, sources: list) -> list[SourceConfig]:
+        return [parse_component_config(registry.sources, source, GenericSourceConfig, "Source")
+                for source in sources]
+
+    @field_validator('destinations', mode='before')
+    @classmethod
+    def validate_destinations(cls, destinations: list) -> list[DestinationConfig]:
+        return [parse_component_config(registry.destinations, destination, GenericDestinationConfig, "Destination")
+                for destination in destinations]
 
 def load_config(config_path: str):
     if not os.path.exists(config_path):
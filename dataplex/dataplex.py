@@ -1,40 +1,33 @@
 import sys
+import math
 import time
+import asyncio
 import logging
+import threading
 import datetime
 from typing import Optional, Union
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import load_config, GeneralConfig
-from .sources import Source, SourceAudio, SourceCSV, SourceOSC, SourcePakbus, SourceUltimeter, SourceWebcam, SourceJDP, SourceSerial, SourceZMQ
-from .destinations import Destination, DestinationJDP, DestinationCSV, DestinationOSC, DestinationStdout, DestinationMidi, DestinationScope, DestinationZMQ
-from .processors import ProcessorSmooth, ProcessorLinearNormalise, ProcessorECDFNormalise
+from .sources import Source, EndOfStream
+from .destinations import Destination, QueuedDestination, DeltaFilter
+from .processors import ThresholdEventDetector, Resampler
 from .buffer import RollingFeatureBuffer
+from .frame import Frame
+from . import registry
 
 logger = logging.getLogger(__name__)
 
 class Dataplex:
-    SOURCE_CLASS_MAP = {
-        "pakbus": SourcePakbus,
-        "ultimeter": SourceUltimeter,
-        "csv": SourceCSV,
-        "osc": SourceOSC,
-        "jdp": SourceJDP,
-        "video": SourceWebcam,
-        "audio": SourceAudio,
-        "serial": SourceSerial,
-        "zmq": SourceZMQ
-    }
-
-    DESTINATION_CLASS_MAP = {
-        "csv": DestinationCSV,
-        "osc": DestinationOSC,
-        "jdp": DestinationJDP,
-        "stdout": DestinationStdout,
-        "midi": DestinationMidi,
-        "scope": DestinationScope,
-        "zmq": DestinationZMQ
-    }
+    #--------------------------------------------------------------
+    # Registries of built-in and plugin classes, which are imported
+    # on first lookup, so that only the dependencies of the sources,
+    # destinations and processors in use are loaded.
+    #--------------------------------------------------------------
+    SOURCE_CLASS_MAP = registry.sources
+    DESTINATION_CLASS_MAP = registry.destinations
+    PROCESSOR_CLASS_MAP = registry.processors
 
     def __init__(self,
                  config_file: str = None):
@@ -52,12 +45,42 @@ class Dataplex:
         """
         self.on_record_callback = None
         self.rolling_buffers = []
-        self.data = {}
+        self.data = Frame()
         self.property_names = []
         self.sources = OrderedDict()
         self.processors = {}
         self.destinations = []
 
+        #--------------------------------------------------------------
+        # The processed value of each property's latest sample, keyed by
+        # property name, as a tuple of (sequence number, value), so that
+        # samples already processed are not processed again. For stale
+        # value interpolation, the last two samples of each property
+        # are kept, as (sample time, value) tuples.
+        #--------------------------------------------------------------
+        self.processed_values = {}
+        self.sample_history = {}
+
+        #--------------------------------------------------------------
+        # If resampling is enabled, the Resampler that aligns properties
+        # from sources at different rates onto the shared clock.
+        #--------------------------------------------------------------
+        self.resampler = None
+
+        #--------------------------------------------------------------
+        # Threshold events, detected after processing each record and
+        # passed to each destination's send_events().
+        #--------------------------------------------------------------
+        self.event_detector = ThresholdEventDetector()
+        self.events = []
+
+        #--------------------------------------------------------------
+        # Set by push-style sources when new data arrives, used by the
+        # event-driven scheduler.
+        #--------------------------------------------------------------
+        self.data_event = threading.Event()
+        self.last_read_time = None
+
         #--------------------------------------------------------------
         # Load config
         #--------------------------------------------------------------
@@ -71,6 +94,7 @@ class Dataplex:
         self.config = config.config
         source_configs = config.sources
         destination_configs = config.destinations
+        event_configs = config.events
 
         #--------------------------------------------------------------
         # Init: Sources
@@ -85,39 +109,22 @@ class Dataplex:
             elif isinstance(source_config.properties, list):
                 property_names = source_config.properties
 
-            if source_config.type == "pakbus":
-                source = SourcePakbus(property_names=property_names)
-            elif source_config.type == "ultimeter":
-                source = SourceUltimeter(property_names=property_names,
-                                         port=source_config.port)
-            elif source_config.type == "csv":
-                source = SourceCSV(path=source_config.path,
-                                   rate=source_config.rate,
-                                   property_names=property_names)
-            elif source_config.type == "jdp":
-                source = SourceJDP(property_names=property_names,
-                                   port=source_config.port)
-            elif source_config.type == "zmq":
-                source = SourceZMQ(property_names=property_names)
-            elif source_config.type == "video":
-                source = SourceWebcam(source.camera_index)
-            elif source_config.type == "audio":
-                source = SourceAudio(properties=property_names)
-            elif source_config.type == "serial":
-                source = SourceSerial(property_names=property_names,
-                                      port_name=source.port_name)
-            else:
-                raise ValueError(f"Source type not known: {source_config.type}")
+            source_class = Dataplex.SOURCE_CLASS_MAP[source_config.type]
+            source = source_class.from_config(source_config, property_names=property_names)
+
+            if source_config.stale_after is not None:
+                source.stale_after = source_config.stale_after
+            if source_config.stale_policy is not None:
+                source.stale_policy = source_config.stale_policy
 
-            # TODO: Refactor to instantiate a source via a type-to-class lookup dict,
-            #       passing name and other params as part of kwargs
             self.sources[source_config.name] = source
 
             if source.property_names:
                 self.property_names += [n for n in source.property_names if n != "time"]
 
                 for name in source.property_names:
-                    self.data[name] = None
+                    if name != "time":
+                        self.data.add_property(name)
 
             for property in source_config.properties:
                 if isinstance(property, dict):
@@ -129,91 +136,294 @@ class Dataplex:
                             processor_params = processor[processor_type]
                             self.add_processor(property["name"], processor_type, **processor_params)
 
+        #--------------------------------------------------------------
+        # Init: Resampling
+        #--------------------------------------------------------------
+        if self.config.resample:
+            self.enable_resampling(mode=self.config.resample.mode,
+                                   window=self.config.resample.window,
+                                   delay=self.config.resample.delay,
+                                   history_size=self.config.resample.history_size)
+            for source_config in source_configs:
+                for property in source_config.properties:
+                    if isinstance(property, dict) and "resample" in property:
+                        self.resampler.add_property(property["name"], **property["resample"])
+
         #--------------------------------------------------------------
         # Init: Destinations
         #--------------------------------------------------------------
         for destination_config in destination_configs:
-            if destination_config.type == "csv":
-                destination = DestinationCSV(property_names=self.property_names,
-                                             path_template=destination_config.path)
-            elif destination_config.type == "osc":
-                destination = DestinationOSC(destination_config.host,
-                                             destination_config.port,
-                                             prefix=destination_config.prefix)
-            elif destination_config.type == "jdp":
-                destination = DestinationJDP(destination_config.host,
-                                             destination_config.port)
-            elif destination_config.type == "stdout":
-                destination = DestinationStdout(property_names=self.property_names)
-            elif destination_config.type == "zmq":
-                destination = DestinationZMQ(property_names=self.property_names)
-            elif destination_config.type == "scope":
-                destination = DestinationScope(property_names=self.property_names)
-            else:
-                raise ValueError(f"Destination type not known: {destination_config.type}")
+            delta = None
+            if getattr(destination_config, "delta", None):
+                delta = DeltaFilter(epsilon=destination_config.delta.epsilon,
+                                    keyframe_interval=destination_config.delta.keyframe_interval)
+
+            destination_class = Dataplex.DESTINATION_CLASS_MAP[destination_config.type]
+            destination = destination_class.from_config(destination_config,
+                                                        property_names=self.property_names,
+                                                        delta=delta)
+
+            if destination_config.queue:
+                destination = QueuedDestination(destination,
+                                                policy=destination_config.queue.policy,
+                                                max_size=destination_config.queue.max_size)
 
             self.destinations.append(destination)
 
+        #--------------------------------------------------------------
+        # Init: Events
+        #--------------------------------------------------------------
+        for event_config in event_configs:
+            self.add_event(event_config.property,
+                           event_config.threshold,
+                           direction=event_config.direction,
+                           hysteresis=event_config.hysteresis,
+                           debounce_time=event_config.debounce_time,
+                           payload=event_config.payload)
+
     def next(self):
         #--------------------------------------------------------------
         # Infinite loop: pull new data and record.
         #--------------------------------------------------------------
         try:
-            record = {}
+            records = []
             for source in self.sources.values():
-                data = source.collect()
-                if data:
-                    record.update(data)
+                records.append(source.collect())
 
         except StopIteration:
             #--------------------------------------------------------------
-            # This should be thrown when a source stream terminates
-            # (TODO: Check if this happens)
+            # This is thrown when a source stream terminates (e.g. at the
+            # end of a CSV file).
             #--------------------------------------------------------------
-            logger.info("Source %s ended stream." % self.source)
+            logger.info("Source %s ended stream." % source)
             raise
 
         #--------------------------------------------------------------
-        # If not specified (e.g. in CSV), set the time to now.
+        # Skip this iteration and retry if data is not yet available.
         #--------------------------------------------------------------
-        if "time" not in record:
-            record["time"] = datetime.datetime.now()
+        if not self.process_record(records):
+            if self.is_realtime:
+                time.sleep(0.1)
+            return
 
         #--------------------------------------------------------------
-        # Register new data
+        # Send current data to each destination
         #--------------------------------------------------------------
-        for key in record:
-            if key == "time":
-                self.data[key] = record[key]
-            else:
-                self.data[key] = record[key]
+        for destination in self.destinations:
+            destination.send(self.data)
+
+        self.dispatch_events()
+        self.handle_record()
+
+        return self.data
+
+    async def next_async(self):
+        """
+        Asynchronous equivalent of next(). Sources are collected concurrently, and
+        the resultant data is sent to all destinations concurrently, so that a slow
+        destination does not delay the others.
+        """
+        records = await asyncio.gather(*(source.collect_async() for source in self.sources.values()))
+
+        if not self.process_record(records):
+            if self.is_realtime:
+                await asyncio.sleep(0.1)
+            return
+
+        await asyncio.gather(*(destination.send_async(self.data) for destination in self.destinations))
+
+        self.dispatch_events()
+        self.handle_record()
+
+        return self.data
+
+    def process_record(self, records: list[dict]) -> bool:
+        """
+        Write newly-collected records into the current frame, passing each property through
+        its processors.
 
-                for processor in self.processors.get(key, []):
-                    self.data[key] = processor.process(self.data[key])
+        Args:
+            records (list[dict]): The data collected from each source, in source order. Sources
+                                  with no new data may return None.
+
+        Returns:
+            bool: True if all properties now have data, False if any are still awaited.
+        """
+        frame = self.data
+        frame.next_tick()
+        sample_times = frame.sample_times
+        sequence_numbers = frame.sequence_numbers
+        source_sample_times = frame.source_sample_times
+        processed_values = self.processed_values
+        get_processors = self.processors.get
+        resampler = self.resampler
+        resampled_property_names = resampler.histories if resampler is not None else ()
+        has_time = False
+        now = time.time()
 
         #--------------------------------------------------------------
-        # If any of our data sources are not yet set (returning None),
-        # skip this iteration.
+        # Register new data, writing each record directly into the
+        # frame, then passing updated properties through processors.
         #--------------------------------------------------------------
-        missing_data = False
-        for key in self.property_names:
-            if self.data[key] is None:
-                logger.warning("Awaiting data for %s..." % key)
-                missing_data = True
+        for (source_name, source), record in zip(self.sources.items(), records):
+            if not record:
+                continue
+
+            #--------------------------------------------------------------
+            # Push sources return their live data dict, to which their
+            # receive threads may add keys at any time, so iterate over
+            # a snapshot of its keys.
+            #--------------------------------------------------------------
+            keys = list(record)
+
+            #--------------------------------------------------------------
+            # Sources that publish() their samples record when each
+            # arrived. For other sources, each record is a new sample.
+            #--------------------------------------------------------------
+            if source.sequence_numbers is None:
+                sample_times.update(dict.fromkeys(keys, now))
+                for key in keys:
+                    sequence_numbers[key] = sequence_numbers.get(key, 0) + 1
+                source_sample_times[source_name] = now
+                if resampler is not None:
+                    record_time = record.get("time")
+                    if isinstance(record_time, datetime.datetime):
+                        resampler.add_samples(record, record_time.timestamp())
+                    else:
+                        resampler.add_samples(record, now)
+            else:
+                sample_times.update(source.sample_times)
+                sequence_numbers.update(source.sequence_numbers)
+                source_sample_times[source_name] = source.last_sample_time
+
+            frame.update(record)
+            if "time" in record:
+                has_time = True
+            for key in keys:
+                processors = get_processors(key)
+                if processors and key != "time" and key not in resampled_property_names:
+                    sequence_number = sequence_numbers.get(key)
+                    processed = processed_values.get(key)
+                    if processed is not None and processed[0] == sequence_number:
+                        frame[key] = processed[1]
+                        continue
+                    value = frame[key]
+                    for processor in processors:
+                        value = processor.process(value)
+                    frame[key] = value
+                    processed_values[key] = (sequence_number, value)
 
         #--------------------------------------------------------------
-        # Skip this iteration and retry.
+        # If not specified (e.g. in CSV), set the time to now.
         #--------------------------------------------------------------
-        if missing_data:
-            time.sleep(0.1)
-            return
+        if not has_time:
+            frame["time"] = datetime.datetime.now()
+
+        if resampler is not None:
+            self.resample_frame()
 
         #--------------------------------------------------------------
-        # Send current data to each destination
+        # If any of our data sources are not yet set (returning None),
+        # skip this iteration.
         #--------------------------------------------------------------
-        for destination in self.destinations:
-            destination.send(self.data)
+        if not frame.is_complete:
+            for key in frame.missing_property_names:
+                logger.warning("Awaiting data for %s..." % key)
+            return False
+
+        if self.is_realtime:
+            self.apply_stale_policy(now)
+
+        return True
+
+    def resample_frame(self):
+        """
+        Replace the values of resampled properties with their values at the frame's time, as
+        interpolated by the resampler, and pass them through their processors.
+        """
+        frame = self.data
+        frame_time = frame["time"]
+        if isinstance(frame_time, datetime.datetime):
+            clock_time = frame_time.timestamp()
+        else:
+            clock_time = time.time()
+
+        values = self.resampler.resample(clock_time)
+        for key, value in values.items():
+            processors = self.processors.get(key)
+            if processors:
+                for processor in processors:
+                    value = processor.process(value)
+            frame[key] = value
+
+    def apply_stale_policy(self, now: float):
+        """
+        Find properties whose latest sample is older than their source's stale_after, and hold,
+        null (set to NaN) or interpolate their values according to its stale_policy. The names of stale
+        properties are recorded in the frame's stale_property_names.
 
+        Args:
+            now (float): The current time, as a UNIX timestamp.
+        """
+        frame = self.data
+        sample_times = frame.sample_times
+        stale_property_names = []
+
+        for source in self.sources.values():
+            stale_after = source.stale_after if source.stale_after is not None else self.config.stale_after
+            if stale_after is None:
+                continue
+            stale_policy = source.stale_policy or self.config.stale_policy
+            property_names = list(source.sample_times if source.sample_times is not None else source.property_names)
+
+            for key in property_names:
+                sample_time = sample_times.get(key)
+                if sample_time is None or key == "time":
+                    continue
+                if stale_policy == "interpolate":
+                    history = self.sample_history.get(key)
+                    if history is None or history[1][0] != sample_time:
+                        history = (history[1] if history else None, (sample_time, frame[key]))
+                        self.sample_history[key] = history
+
+                age = now - sample_time
+                if age <= stale_after:
+                    continue
+                stale_property_names.append(key)
+
+                if stale_policy == "null":
+                    #--------------------------------------------------------------
+                    # Stale values are marked missing with NaN rather than None,
+                    # which destinations (e.g. CSV, with "%.3f") cannot format.
+                    #--------------------------------------------------------------
+                    frame[key] = math.nan
+                elif stale_policy == "interpolate" and history[0] is not None:
+                    (previous_time, previous_value), (last_time, last_value) = history
+                    if last_time > previous_time and isinstance(last_value, (int, float)):
+                        slope = (last_value - previous_value) / (last_time - previous_time)
+                        frame[key] = last_value + slope * min(age, stale_after)
+
+        if stale_property_names or frame.stale_property_names:
+            if stale_property_names:
+                logger.debug("Stale data for %s" % ", ".join(stale_property_names))
+            frame.stale_property_names = frozenset(stale_property_names)
+
+    def dispatch_events(self):
+        """
+        Detect threshold events in the current record, and pass them to each destination.
+        """
+        self.events = self.event_detector.process(self.data)
+        if self.events:
+            for event in self.events:
+                logger.debug("Event: %s" % event)
+            for destination in self.destinations:
+                destination.send_events(self.events)
+
+    def handle_record(self):
+        """
+        Post-send handling of the current record: triggers the on_record callback,
+        and appends to any rolling buffers.
+        """
         #--------------------------------------------------------------
         # If present, trigger the on_record callback.
         #--------------------------------------------------------------
@@ -223,9 +433,6 @@ class Dataplex:
         for rolling_buffer in self.rolling_buffers:
             rolling_buffer.append(self.data)
 
-        return self.data
-    
-
     def __iter__(self):
         self.initialise()
         return self
@@ -234,9 +441,71 @@ class Dataplex:
         #--------------------------------------------------------------
         # Wait until next cycle
         #--------------------------------------------------------------
-        time.sleep(self.config.read_interval)
+        self.wait()
         return self.next()
-    
+
+    def wait(self):
+        """
+        Block until the next read is due, according to the configured scheduler.
+
+        If any source is offline (e.g. a CSV file in fast replay mode), returns immediately,
+        so that data is processed as fast as possible. In interval mode, sleeps for read_interval. In event mode, wakes as soon as
+        a push-style source signals new data, or after heartbeat_interval seconds
+        if no data arrives, and sleeps as needed to read at most max_rate times
+        per second.
+        """
+        if not self.is_realtime:
+            pass
+        elif self.config.scheduler == "event":
+            self.data_event.wait(timeout=self.config.heartbeat_interval)
+            time.sleep(self.get_rate_limit_delay())
+
+            #--------------------------------------------------------------
+            # Clear the event before reading, so that any data arriving
+            # during this read triggers the next one.
+            #--------------------------------------------------------------
+            self.data_event.clear()
+        else:
+            time.sleep(self.config.read_interval)
+
+        self.last_read_time = time.monotonic()
+
+    async def wait_async(self):
+        """
+        Asynchronous equivalent of wait().
+        """
+        if not self.is_realtime:
+            await asyncio.sleep(0)
+        elif self.config.scheduler == "event":
+            await asyncio.to_thread(self.data_event.wait, self.config.heartbeat_interval)
+            await asyncio.sleep(self.get_rate_limit_delay())
+            self.data_event.clear()
+        else:
+            await asyncio.sleep(self.config.read_interval)
+
+        self.last_read_time = time.monotonic()
+
+    @property
+    def is_realtime(self) -> bool:
+        """
+        False if any source is offline, in which case the main loop runs on the virtual
+        clock of the source's timestamps rather than waiting between reads.
+        """
+        return all(source.is_realtime for source in self.sources.values())
+
+    def get_rate_limit_delay(self) -> float:
+        """
+        Returns:
+            float: The number of seconds to wait before the next read, to limit the
+                   read rate to max_rate. Zero if no limit is set.
+        """
+        if self.config.max_rate and self.last_read_time is not None:
+            min_interval = 1.0 / self.config.max_rate
+            elapsed = time.monotonic() - self.last_read_time
+            if elapsed < min_interval:
+                return min_interval - elapsed
+        return 0.0
+
     def initialise(self):
         #--------------------------------------------------------------
         # Print output
@@ -256,16 +525,64 @@ class Dataplex:
         # set during setup.
         #------------------------------------------------------------------------------
         for source in self.sources.values():
+            source.set_data_event(self.data_event)
             source.start()
 
+        if self.config.scheduler == "event" and not any(source.is_push for source in self.sources.values()):
+            logger.warning("Event scheduler selected, but no push-style sources are present. "
+                           "Reading every %s seconds." % self.config.heartbeat_interval)
+
     def run(self):
         """
         Run the main server process, blocking indefinitely.
         """
         self.initialise()
 
-        while True:
-            next(self)
+        try:
+            while True:
+                next(self)
+        except StopIteration:
+            logger.info("Dataplex: Source stream ended, stopping")
+        finally:
+            self.close()
+
+    async def run_async(self):
+        """
+        Run the main server process within an asyncio event loop, blocking indefinitely.
+        Sources and destinations that implement collect_async() / send_async() are awaited
+        natively; synchronous sources and destinations are run in worker threads.
+
+        Example:
+            asyncio.run(dataplex.run_async())
+        """
+        self.initialise()
+
+        #--------------------------------------------------------------
+        # Size the worker pool so that every synchronous source and
+        # destination can run concurrently.
+        #--------------------------------------------------------------
+        max_workers = len(self.sources) + len(self.destinations) + 1
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
+
+        try:
+            while True:
+                await self.wait_async()
+                await self.next_async()
+        except EndOfStream:
+            logger.info("Dataplex: Source stream ended, stopping")
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Close all sources and destinations, flushing any buffered output.
+        """
+        for source in self.sources.values():
+            if hasattr(source, "close"):
+                source.close()
+        for destination in self.destinations:
+            if hasattr(destination, "close"):
+                destination.close()
 
     def add_source(self,
                    source: Optional[Source] = None,
@@ -282,10 +599,14 @@ class Dataplex:
             if type not in Dataplex.SOURCE_CLASS_MAP:
                 raise ValueError(f"Source type not known: {type}")
             source = Dataplex.SOURCE_CLASS_MAP[type](**kwargs)
-            self.sources[type] = source
+            self.sources[self.get_unique_source_name(type)] = source
         elif source is not None:
-            source_name = list(filter(lambda type: isinstance(source, Dataplex.SOURCE_CLASS_MAP[type]), Dataplex.SOURCE_CLASS_MAP.keys()))[0]
-            self.sources[source_name] = source
+            #--------------------------------------------------------------
+            # Sources whose class is not registered (e.g. defined in a
+            # script) are named after their class.
+            #--------------------------------------------------------------
+            source_name = Dataplex.SOURCE_CLASS_MAP.get_type_name(source) or source.__class__.__name__.lower()
+            self.sources[self.get_unique_source_name(source_name)] = source
         else:
             raise ValueError("Either source or type must be provided")
 
@@ -293,38 +614,122 @@ class Dataplex:
             for property_name, property_type in properties.items():
                 if property_name not in self.property_names:
                     if property_type == "float":
-                        self.data[property_name] = None
+                        self.data.add_property(property_name)
 
                         self.property_names.append(property_name)
                     elif property_type == "vec3":
                         for suffix in ["x", "y", "z"]:
                             property_subname = "%s_%s" % (property_name, suffix)
                             print("Adding property %s" % property_subname)
-                            self.data[property_subname] = None
+                            self.data.add_property(property_subname)
                             self.property_names.append(property_subname)
+
+        if self.resampler is not None:
+            source.resampler = self.resampler
+            for property_name in self.property_names:
+                if property_name not in self.resampler.histories:
+                    self.resampler.add_property(property_name)
         return source
 
+    def get_unique_source_name(self, name: str) -> str:
+        """
+        Returns:
+            str: The given name, with a numeric suffix if a source of that name already exists,
+                 so that adding a source never replaces another.
+        """
+        if name not in self.sources:
+            return name
+        index = 2
+        while "%s_%d" % (name, index) in self.sources:
+            index += 1
+        return "%s_%d" % (name, index)
+
     def add_destination(self,
                         destination: Optional[Union[str, Destination]] = None,
+                        queue: Optional[dict] = None,
                         **kwargs):
         """
         Add a destination to the server.
 
         Args:
             destination (Destination): The destination object to add.
+            queue (dict, optional): If specified, sends to this destination are made on a
+                                    dedicated worker thread, behind a bounded queue.
+                                    Takes the keyword arguments of QueuedDestination
+                                    (e.g. {"policy": "coalesce"}).
         """
         if isinstance(destination, str):
             if destination not in Dataplex.DESTINATION_CLASS_MAP:
                 raise ValueError(f"Destination type not known: {destination}")
             destination = Dataplex.DESTINATION_CLASS_MAP[destination](**kwargs)
-            self.destinations.append(destination)
-        elif isinstance(destination, Destination):
-            self.destinations.append(destination)
-        else:
+        elif not isinstance(destination, Destination):
             raise ValueError("Destination %s invalid" % destination)
 
+        if queue is not None:
+            destination = QueuedDestination(destination, **queue)
+        self.destinations.append(destination)
+
         return destination
 
+    def get_destination_metrics(self) -> dict:
+        """
+        Get the send queue metrics for each queued destination.
+
+        Returns:
+            dict: A dict of metrics dicts, keyed by destination description.
+        """
+        return dict((str(destination), destination.metrics)
+                    for destination in self.destinations
+                    if isinstance(destination, QueuedDestination))
+
+    def enable_resampling(self,
+                          mode: str = "hold",
+                          window: Optional[float] = None,
+                          delay: float = 0.0,
+                          history_size: int = 256) -> Resampler:
+        """
+        Resample all properties onto the shared clock, so that each frame holds the values of
+        every property at the frame's time, rather than whatever was latest from each source.
+        Push-style sources record every sample in the resampler as it arrives, so the main loop
+        can run at the rate of the frames required, not the rate of the fastest source.
+
+        Properties added after this call, or with settings other than the defaults, can be
+        registered with resampler.add_property().
+
+        Args:
+            mode (str, optional): The interpolation mode: "hold", "linear" or "mean". Defaults to "hold".
+            window (float, optional): The window for "mean" mode, in seconds. Defaults to read_interval.
+            delay (float, optional): The time by which output lags the clock, in seconds. Defaults to 0.0.
+            history_size (int, optional): The number of samples retained per property. Defaults to 256.
+
+        Returns:
+            Resampler: The resampler.
+        """
+        if mode == "mean" and window is None:
+            window = self.config.read_interval
+        self.resampler = Resampler(mode=mode, window=window, delay=delay, history_size=history_size)
+        for property_name in self.property_names:
+            self.resampler.add_property(property_name)
+        for source in self.sources.values():
+            source.resampler = self.resampler
+        return self.resampler
+
+    def add_event(self,
+                  property_name: str,
+                  threshold: float,
+                  **kwargs):
+        """
+        Add a threshold event, which is triggered when the given property's processed value
+        crosses the threshold. Triggered events are passed to each destination's send_events().
+
+        Args:
+            property_name (str): The name of the property to track.
+            threshold (float): The threshold value.
+            kwargs: Additional keyword arguments for ThresholdEventDetector.add_threshold()
+                    (direction, hysteresis, debounce_time, payload).
+        """
+        self.event_detector.add_threshold(property_name, threshold, **kwargs)
+
     def add_processor(self,
                       property_name: str,
                       processor_type: str,
@@ -340,24 +745,39 @@ class Dataplex:
         if property_name not in self.processors:
             self.processors[property_name] = []
 
-        if processor_type == "smooth":
-            processor = ProcessorSmooth(**processor_params)
-            self.processors[property_name].append(processor)
-        elif processor_type == "normalise":
-            normalise_type = processor_params["type"]
-            del processor_params["type"]
-            if normalise_type == "linear":
-                processor = ProcessorLinearNormalise(**processor_params)
-            elif normalise_type == "ecdf":
-                processor = ProcessorECDFNormalise(**processor_params)
-            elif normalise_type == "none":
-                processor = None
-            else:
-                raise ValueError(f"Normalise type not known: {normalise_type}")
-            if processor is not None:
-                self.processors[property_name].append(processor)
-        else:
+        #--------------------------------------------------------------
+        # Normalisers are specified as {"normalise": {"type": ...}}, and
+        # are registered under their normalise type.
+        #--------------------------------------------------------------
+        if processor_type == "normalise":
+            processor_type = processor_params.pop("type")
+            if processor_type == "none":
+                return
+            if processor_type not in Dataplex.PROCESSOR_CLASS_MAP:
+                raise ValueError(f"Normalise type not known: {processor_type}")
+
+        if processor_type not in Dataplex.PROCESSOR_CLASS_MAP:
             logger.warning("Processor type %s not implemented" % processor_type)
+            return
+
+        processor = Dataplex.PROCESSOR_CLASS_MAP[processor_type](**processor_params)
+        self.processors[property_name].append(processor)
+
+    def process_batch(self, property_name: str, values):
+        """
+        Pass an array of values for a property through its chain of processors, with results
+        identical to processing each value in turn. Used for fast offline reprocessing.
+
+        Args:
+            property_name (str): The name of the property.
+            values (np.ndarray): The values to process. Missing values should be given as NaN.
+
+        Returns:
+            np.ndarray: The processed values.
+        """
+        for processor in self.processors.get(property_name, []):
+            values = processor.process_batch(values)
+        return values
 
     def get_source(self, name) -> Source:
         """
@@ -1,8 +1,21 @@
 from .destination import Destination
-from .osc import DestinationOSC
-from .jdp import DestinationJDP
-from .csv import DestinationCSV
-from .stdout import DestinationStdout
-from .midi import DestinationMidi
-from .scope import DestinationScope
-from .zmq import DestinationZMQ
\ No newline at end of file
+from .queued import QueuedDestination
+from .delta import DeltaFilter
+from ..registry import lazy_module_getattr
+
+#--------------------------------------------------------------------------------
+# Destinations are imported on first access, so that each destination's
+# dependencies (e.g. python-osc, mido, jdp, zmq) are only imported if it is used.
+#--------------------------------------------------------------------------------
+__getattr__ = lazy_module_getattr(__name__, {
+    "DestinationOSC": ".osc",
+    "DestinationJDP": ".jdp",
+    "DestinationCSV": ".csv",
+    "DestinationNPY": ".npy",
+    "DestinationStdout": ".stdout",
+    "DestinationMidi": ".midi",
+    "DestinationScope": ".scope",
+    "DestinationZMQ": ".zmq",
+    "DestinationSharedMemory": ".shm",
+    "SharedMemoryReader": ".shm"
+})
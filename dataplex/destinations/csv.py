@@ -1,7 +1,10 @@
 import os
 import csv
+import time
 import logging
 import datetime
+import threading
+from typing import Optional
 
 from .destination import Destination
 
@@ -12,30 +15,146 @@ DEFAULT_CSV_PATH = "logs/data.%Y%m%d.%H%M%S.csv"
 class DestinationCSV (Destination):
     def __init__(self,
                  property_names: list[str],
-                 path_template: str = DEFAULT_CSV_PATH):
+                 path_template: str = DEFAULT_CSV_PATH,
+                 flush_rows: int = 100,
+                 flush_interval: float = 1.0,
+                 fsync: bool = False,
+                 rotate_interval: Optional[float] = None,
+                 rotate_size: Optional[int] = None):
+        """
+        Log data to a CSV file. Rows are staged in memory and written in batches.
+
+        Args:
+            property_names (list[str]): The properties to log.
+            path_template (str, optional): The path to write to, formatted with strftime.
+            flush_rows (int, optional): Write staged rows once this many have accumulated. Defaults to 100.
+            flush_interval (float, optional): Write staged rows once the oldest was staged this many
+                                              seconds ago. A timer ensures this happens even if no
+                                              further rows are sent. Defaults to 1.0.
+            fsync (bool, optional): If True, fsync the file after each write, so that rows are durable
+                                    on disk. Defaults to False.
+            rotate_interval (float, optional): If specified, start a new file every rotate_interval seconds,
+                                               with its path formatted by path_template at the current time.
+            rotate_size (int, optional): If specified, start a new file once the current file exceeds
+                                         this many bytes.
+        """
+        self.property_names = property_names
+        self.path_template = path_template
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.rotate_interval = rotate_interval
+        self.rotate_size = rotate_size
+
+        #--------------------------------------------------------------
+        # Format string for a complete row, to avoid formatting each
+        # value separately.
+        #--------------------------------------------------------------
+        self.row_format = ",".join(["%s"] + ["%.3f"] * len(property_names)) + "\n"
+
+        self.rows = []
+        self.staged_time = None
+        self.flush_timer = None
+        self.logfd = None
+
+        #--------------------------------------------------------------
+        # Staged rows may be flushed by the flush timer's thread.
+        #--------------------------------------------------------------
+        self.lock = threading.RLock()
+        self.open()
+
+    @classmethod
+    def from_config(cls, config, property_names: list[str], **kwargs):
+        return super().from_config(config, property_names, path_template=config.path, **kwargs)
+
+    def __str__(self):
+        return "CSV (%s)" % (os.path.basename(self.path))
+
+    def open(self):
         #--------------------------------------------------------------
         # Format the CSV path template according to the current time
         #--------------------------------------------------------------
-        self.property_names = property_names
         now = datetime.datetime.now()
-        self.path = now.strftime(path_template)
+        path = now.strftime(self.path_template)
+
+        #--------------------------------------------------------------
+        # When rotating within the resolution of the path template,
+        # don't overwrite the existing file.
+        #--------------------------------------------------------------
+        if os.path.exists(path):
+            base, extension = os.path.splitext(path)
+            index = 1
+            while os.path.exists("%s.%d%s" % (base, index, extension)):
+                index += 1
+            path = "%s.%d%s" % (base, index, extension)
 
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.path = path
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
         self.logfd = open(self.path, "w")
         self.logwriter = csv.writer(self.logfd)
-        self.logwriter.writerow(["time"] + property_names)
-
-    def __str__(self):
-        return "CSV (%s)" % (os.path.basename(self.path))
+        self.logwriter.writerow(["time"] + self.property_names)
+        self.opened_time = time.monotonic()
+        self.bytes_written = self.logfd.tell()
 
     def send(self, data: dict):
         #--------------------------------------------------------------
-        # write the latest set of data to logfile.
+        # stage the latest set of data for writing to logfile.
         #--------------------------------------------------------------
-        now = str(data["time"])
-        row = [now] + ["%.3f" % data[key] for key in self.property_names]
-        self.logwriter.writerow(row)
-        logger.debug("DestinationCSV: Log row: %s" % row)
+        row = self.row_format % ((data["time"],) + tuple(data[key] for key in self.property_names))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DestinationCSV: Log row: %s" % row.rstrip())
+
+        with self.lock:
+            self.rows.append(row)
+            now = time.monotonic()
+            if self.staged_time is None:
+                self.staged_time = now
+                self.flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+
+            if len(self.rows) >= self.flush_rows or now - self.staged_time >= self.flush_interval:
+                self.flush()
+
+            if (self.rotate_interval is not None and now - self.opened_time >= self.rotate_interval) or \
+               (self.rotate_size is not None and self.bytes_written >= self.rotate_size):
+                self.rotate()
+
+    def flush(self):
+        """
+        Write all staged rows to the logfile.
+        """
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            self.staged_time = None
+            if self.logfd is None:
+                return
+
+            if self.rows:
+                text = "".join(self.rows)
+                self.logfd.write(text)
+                self.bytes_written += len(text)
+                self.rows = []
+
+            self.logfd.flush()
+            if self.fsync:
+                os.fsync(self.logfd.fileno())
+
+    def rotate(self):
+        """
+        Close the current logfile and begin a new one.
+        """
+        with self.lock:
+            self.close()
+            self.open()
+        logger.info("DestinationCSV: Rotated to new logfile: %s" % self.path)
 
     def close(self):
-        self.logfd.close()
+        with self.lock:
+            if self.logfd is not None:
+                self.flush()
+                self.logfd.close()
+                self.logfd = None
@@ -0,0 +1,80 @@
+import time
+from typing import Union
+
+class DeltaFilter:
+    def __init__(self,
+                 epsilon: Union[float, dict[str, float]] = 0.0,
+                 keyframe_interval: float = 5.0):
+        """
+        Reduces each frame to the properties whose values have changed since they were last sent,
+        for destinations publishing in delta mode. A full-state keyframe is sent periodically, so
+        that receivers joining mid-stream can resynchronise.
+
+        Receivers are expected to merge each frame into their existing state, as SourceJDP and
+        SourceZMQ do. The "time" property is always included.
+
+        Args:
+            epsilon (float | dict, optional): The minimum change in value for a property to be resent.
+                                              Either a single value for all properties, or a dict of
+                                              per-property values, with any omitted properties
+                                              resent on any change. Defaults to 0.0.
+            keyframe_interval (float, optional): The interval between full-state keyframes, in seconds.
+                                                 Defaults to 5.0.
+        """
+        if isinstance(epsilon, dict):
+            self.epsilon = epsilon
+            self.default_epsilon = 0.0
+        else:
+            self.epsilon = {}
+            self.default_epsilon = epsilon
+        self.keyframe_interval = keyframe_interval
+
+        self.last_sent = {}
+        self.last_keyframe_time = None
+
+    def reset(self):
+        """
+        Force the next frame to be sent as a keyframe.
+        """
+        self.last_sent = {}
+        self.last_keyframe_time = None
+
+    def filter(self, data: dict) -> tuple[dict, bool]:
+        """
+        Filter a frame to its changed properties.
+
+        Args:
+            data (dict): The full frame.
+
+        Returns:
+            tuple: A tuple of (frame, is_keyframe). If is_keyframe is True, the frame is the full frame.
+        """
+        now = time.monotonic()
+        if self.last_keyframe_time is None or now - self.last_keyframe_time >= self.keyframe_interval:
+            self.last_keyframe_time = now
+            self.last_sent = dict(data)
+            return data, True
+
+        delta = {}
+        last_sent = self.last_sent
+        for name, value in data.items():
+            if name == "time":
+                delta[name] = value
+                continue
+            if name in last_sent:
+                previous = last_sent[name]
+                if value == previous:
+                    continue
+                if value is not None and previous is not None:
+                    try:
+                        if abs(value - previous) <= self.epsilon.get(name, self.default_epsilon):
+                            continue
+                    except TypeError:
+                        #--------------------------------------------------------------
+                        # Non-numeric values are resent on any change.
+                        #--------------------------------------------------------------
+                        pass
+            delta[name] = value
+            last_sent[name] = value
+
+        return delta, False
@@ -1,2 +1,49 @@
+import asyncio
+
+from ..registry import create_from_config
+
 class Destination:
-    pass
+    @classmethod
+    def from_config(cls, config, property_names: list[str], **kwargs):
+        """
+        Create a destination from its config. By default, each config field is passed to the
+        constructor as a keyword argument, if the constructor accepts it. Subclasses whose
+        constructor arguments differ from their config fields should override this method.
+
+        Args:
+            config (DestinationConfig): The destination's config.
+            property_names (list[str]): The names of the properties to send.
+            kwargs: Objects constructed from the config by Dataplex (e.g. delta), passed if accepted.
+
+        Returns:
+            Destination: The new destination.
+        """
+        return create_from_config(cls, config,
+                                  exclude=["type", "queue"],
+                                  property_names=property_names,
+                                  **kwargs)
+
+    def send_events(self, events: list):
+        """
+        Handle events triggered by the current frame (e.g. threshold crossings detected by
+        ThresholdEventDetector). Called by Dataplex after send(), only when events occur.
+
+        By default, events are ignored. Subclasses that can render events should override this method.
+
+        Args:
+            events (list[ThresholdEvent]): The events.
+        """
+        pass
+
+    async def send_async(self, data: dict):
+        """
+        Asynchronous equivalent of send(), used by Dataplex.run_async().
+
+        Subclasses with a native asyncio implementation should override this method.
+        By default, send() is run in a worker thread, so that sends to multiple
+        destinations can proceed concurrently.
+
+        Args:
+            data (dict): The data to send.
+        """
+        await asyncio.to_thread(self.send, data)
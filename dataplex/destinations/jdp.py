@@ -1,17 +1,32 @@
 import jdp
 import logging
-from ..utils import serialise_data
+from typing import Optional
+from ..utils import frame_serialiser
 
 from .destination import Destination
+from .delta import DeltaFilter
 
 logger = logging.getLogger(__name__)
 
 
 class DestinationJDP (Destination):
-    def __init__(self, host, port):
+    def __init__(self, host, port, delta: Optional[DeltaFilter] = None):
+        """
+        Send data over JSON Datagram Protocol.
+
+        Args:
+            host (str): The host to send to.
+            port (int): The port to send to.
+            delta (DeltaFilter, optional): If specified, send only the properties that have changed
+                                           beyond their epsilon, plus periodic full-state keyframes.
+        """
         self.client = jdp.JDPClient(host, port)
+        self.delta = delta
 
     def send(self, data):
-        structure = serialise_data(data)
-        logger.debug("DestinationJDP: Send packet: %s" % structure)
+        if self.delta:
+            data, _ = self.delta.filter(data)
+        structure = frame_serialiser.serialise(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DestinationJDP: Send packet: %s" % structure)
         self.client.send(structure)
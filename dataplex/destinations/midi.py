@@ -1,44 +1,122 @@
 import mido
 import time
+import heapq
+import logging
 import threading
-from typing import Callable
+from typing import Callable, Optional
 
 from .destination import Destination
+from ..processors.events import ThresholdEventDetector
 
-class EventTracker:
-    def __init__(self, property: str, when: str, value: float, debounce_time: float, action: Callable):
-        self.property = property
-        self.when = when
-        self.value = value
-        self.debounce_time = debounce_time
-        self.action = action
+logger = logging.getLogger(__name__)
 
-        self.last_triggered = None
-        self.last_value = None
+#--------------------------------------------------------------
+# Maps add_event() trigger conditions to threshold directions.
+#--------------------------------------------------------------
+EVENT_DIRECTIONS = {
+    "value_crossed": "both",
+    "value_rising": "up",
+    "value_falling": "down"
+}
 
-    def process(self, data):
-        current_value = data[self.property]
+class NoteOffScheduler:
+    def __init__(self, send: Callable):
+        """
+        Sends scheduled note_off messages from a single thread, using a heap of due times.
 
-        if self.last_triggered is None or (time.time() - self.last_triggered >= self.debounce_time):
-            if self.when == "value_crossed":
-                if self.last_value is None or (self.last_value < self.value and current_value >= self.value) \
-                    or (self.last_value > self.value and current_value <= self.value):                
-                    self.action(data)
-                    self.last_triggered = time.time()
+        If a note is retriggered before its note_off is due, its note_off is rescheduled,
+        so that the earlier note_off does not cut the new note short.
 
-        self.last_value = current_value
-        
+        Args:
+            send (Callable): The function used to send each note_off message.
+        """
+        self.send = send
+        self.heap = []
+        self.due_times = {}
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def schedule(self, message: mido.Message, delay: float):
+        """
+        Schedule a note_off message to be sent after the given delay, in seconds.
+        """
+        due_time = time.monotonic() + delay
+        key = (message.channel, message.note)
+        with self.condition:
+            self.due_times[key] = due_time
+            heapq.heappush(self.heap, (due_time, key, message))
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.running and (not self.heap or self.heap[0][0] > time.monotonic()):
+                    timeout = self.heap[0][0] - time.monotonic() if self.heap else None
+                    self.condition.wait(timeout)
+                if not self.running:
+                    return
+                due_time, key, message = heapq.heappop(self.heap)
+                #--------------------------------------------------------------
+                # Skip entries superseded by a retrigger of the same note.
+                #--------------------------------------------------------------
+                if self.due_times.get(key) != due_time:
+                    continue
+                del self.due_times[key]
+            self.send(message)
+
+    def close(self):
+        """
+        Stop the scheduler thread, sending any pending note_offs immediately
+        so that no notes are left hanging.
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+            pending = [message for due_time, key, message in self.heap if self.due_times.get(key) == due_time]
+            self.heap = []
+            self.due_times = {}
+        self.thread.join()
+        for message in pending:
+            self.send(message)
 
 class DestinationMidi (Destination):
-    def __init__(self, port_name):
+    def __init__(self,
+                 port_name: str,
+                 channel: int = 0,
+                 note_duration: float = 1.0):
+        """
+        Send data as MIDI control changes, and trigger notes on events.
+
+        Args:
+            port_name (str): The name of the MIDI output port.
+            channel (int, optional): The MIDI channel to send on. Defaults to 0.
+            note_duration (float, optional): The default duration of triggered notes, in seconds.
+                                             Defaults to 1.0.
+        """
         self.port_name = port_name
+        self.channel = channel
+        self.note_duration = note_duration
         self.output = mido.open_output(self.port_name)
+        self.output_lock = threading.Lock()
         self.mappings = {}
-        self.event_trackers = []
+        self.event_detector = ThresholdEventDetector()
+
+        #--------------------------------------------------------------
+        # The last 7-bit value sent for each CC, so that only changes
+        # are sent.
+        #--------------------------------------------------------------
+        self.cc_values = {}
+        self.scheduler = NoteOffScheduler(self.send_message)
 
     def __str__(self):
         return "Midi (%s)" % (self.port_name)
-    
+
+    def send_message(self, message: mido.Message):
+        with self.output_lock:
+            self.output.send(message)
+
     def add_mapping(self, property: str, cc: int):
         self.mappings[property] = cc
     
@@ -47,24 +125,69 @@ class DestinationMidi (Destination):
                   when: str,
                   value: float,
                   note: int,
-                  debounce_time: float = 0.5):
-        
-        def action(data):            
-            msg = mido.Message("note_on", channel=0, note=note, velocity=64)
-            self.output.send(msg)
-            def note_off_thread():
-                time.sleep(1.0)
-                msg = mido.Message("note_off", channel=0, note=note, velocity=64)
-                self.output.send(msg)
-            threading.Thread(target=note_off_thread).start()
-        event = EventTracker(property, when, value, debounce_time, action=action)
-        self.event_trackers.append(event)
+                  debounce_time: float = 0.5,
+                  velocity: int = 64,
+                  duration: Optional[float] = None,
+                  hysteresis: float = 0.0):
+        """
+        Trigger a note when a property's value crosses a threshold.
+
+        Args:
+            property (str): The property to track.
+            when (str): The trigger condition: "value_crossed" (in either direction), "value_rising"
+                        or "value_falling".
+            value (float): The threshold value.
+            note (int): The MIDI note to trigger.
+            debounce_time (float, optional): The minimum interval between triggers, in seconds. Defaults to 0.5.
+            velocity (int, optional): The note velocity. Defaults to 64.
+            duration (float, optional): The note duration, in seconds. Defaults to the destination's note_duration.
+            hysteresis (float, optional): The distance the value must move back past the threshold before
+                                          it can trigger again. Defaults to 0.0.
+        """
+        if when not in EVENT_DIRECTIONS:
+            raise ValueError("Event condition not known: %s" % when)
+        self.event_detector.add_threshold(property,
+                                          value,
+                                          direction=EVENT_DIRECTIONS[when],
+                                          hysteresis=hysteresis,
+                                          debounce_time=debounce_time,
+                                          payload={"note": note, "velocity": velocity, "duration": duration})
+
+    def send_events(self, events: list):
+        """
+        Play a note for each event whose payload specifies a "note", plus optional "velocity"
+        and "duration". Events from Dataplex.add_event() can specify a payload in the same form.
+        """
+        for event in events:
+            if not isinstance(event.payload, dict) or "note" not in event.payload:
+                continue
+            note = event.payload["note"]
+            velocity = event.payload.get("velocity", 64)
+            duration = event.payload.get("duration")
+            if duration is None:
+                duration = self.note_duration
+            self.send_message(mido.Message("note_on", channel=self.channel, note=note, velocity=velocity))
+            self.scheduler.schedule(mido.Message("note_off", channel=self.channel, note=note, velocity=velocity),
+                                    duration)
 
     def send(self, data):
-        for name, record in list(data.items()):
-            if name in self.mappings:
-                cc = self.mappings[name]
-                msg = mido.Message("control_change", channel=0, control=cc, value=int(record * 127))
-                self.output.send(msg)
-        for event_tracker in self.event_trackers:
-            event_tracker.process(data)
\ No newline at end of file
+        for name, cc in self.mappings.items():
+            record = data.get(name)
+            #--------------------------------------------------------------
+            # Skip missing values: None, or NaN (e.g. stale values).
+            #--------------------------------------------------------------
+            if record is None or record != record:
+                continue
+            value = min(max(int(record * 127), 0), 127)
+            if self.cc_values.get(cc) == value:
+                continue
+            self.cc_values[cc] = value
+            self.send_message(mido.Message("control_change", channel=self.channel, control=cc, value=value))
+
+        events = self.event_detector.process(data)
+        if events:
+            self.send_events(events)
+
+    def close(self):
+        self.scheduler.close()
+        self.output.close()
@@ -0,0 +1,159 @@
+import os
+import json
+import time
+import logging
+import datetime
+import threading
+import numpy as np
+from typing import Optional
+
+from .destination import Destination
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NPY_PATH = "logs/data.%Y%m%d.%H%M%S.npylog"
+
+#--------------------------------------------------------------
+# Layout of a .npylog directory:
+#  - schema.json: the ordered list of property names, plus format metadata
+#  - NNNNNN.time.npy: int64 array of nanosecond timestamps, one per row
+#  - NNNNNN.values.npy: 2D array of shape (properties, rows), so that each
+#    property's values are contiguous
+#
+# The last row group may be partial: it is rewritten (atomically, via a
+# temporary file) every flush_interval seconds until it is full.
+#--------------------------------------------------------------
+NPY_FORMAT_NAME = "dataplex-npylog"
+NPY_FORMAT_VERSION = 1
+
+def get_chunk_paths(path: str, index: int) -> tuple[str, str]:
+    """
+    Returns:
+        tuple: The paths of the time and values files for the given row group.
+    """
+    return (os.path.join(path, "%06d.time.npy" % index),
+            os.path.join(path, "%06d.values.npy" % index))
+
+class DestinationNPY (Destination):
+    def __init__(self,
+                 property_names: list[str],
+                 path_template: str = DEFAULT_NPY_PATH,
+                 row_group_size: int = 10000,
+                 dtype: str = "float64",
+                 flush_interval: Optional[float] = 10.0):
+        """
+        Log data in a columnar binary format, as a directory of NumPy .npy files written in
+        fixed-size row groups. Logs can be replayed with SourceNPY, which memory-maps each file.
+
+        Args:
+            property_names (list[str]): The properties to log.
+            path_template (str, optional): The directory to write to, formatted with strftime.
+            row_group_size (int, optional): The number of rows per file. Defaults to 10000.
+            dtype (str, optional): The data type of values. Use "float32" to halve file size,
+                                   at reduced precision. Defaults to "float64".
+            flush_interval (float, optional): Write the rows of a partial row group to disk once the
+                                              oldest unwritten row was sent this many seconds ago, so
+                                              that no more than this much data is lost if the process
+                                              is killed. A timer ensures this happens even if no
+                                              further rows are sent. If None, rows are only written
+                                              when a row group is full, or on close(). Defaults to 10.0.
+        """
+        self.property_names = property_names
+        self.row_group_size = row_group_size
+        self.dtype = np.dtype(dtype)
+        self.flush_interval = flush_interval
+
+        now = datetime.datetime.now()
+        self.path = now.strftime(path_template)
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, "schema.json"), "w") as fd:
+            json.dump({
+                "format": NPY_FORMAT_NAME,
+                "version": NPY_FORMAT_VERSION,
+                "property_names": property_names,
+                "dtype": self.dtype.name,
+                "row_group_size": row_group_size
+            }, fd, indent=4)
+
+        self.times = np.zeros(row_group_size, dtype=np.int64)
+        self.values = np.zeros((len(property_names), row_group_size), dtype=self.dtype)
+        self.row_count = 0
+        self.row_group_index = 0
+
+        #--------------------------------------------------------------
+        # The number of rows of the current row group on disk, and the
+        # time that the first row not yet on disk was sent. Partial row
+        # groups may be written by the flush timer's thread.
+        #--------------------------------------------------------------
+        self.written_row_count = 0
+        self.unwritten_time = None
+        self.flush_timer = None
+        self.lock = threading.RLock()
+
+    @classmethod
+    def from_config(cls, config, property_names: list[str], **kwargs):
+        return super().from_config(config, property_names, path_template=config.path, **kwargs)
+
+    def __str__(self):
+        return "NPY (%s)" % (os.path.basename(self.path))
+
+    def send(self, data: dict):
+        with self.lock:
+            index = self.row_count
+            self.times[index] = np.datetime64(data["time"], "ns").astype(np.int64)
+            for property_index, key in enumerate(self.property_names):
+                value = data[key]
+                self.values[property_index, index] = np.nan if value is None else value
+
+            self.row_count += 1
+            if self.row_count == self.row_group_size:
+                self.flush()
+            elif self.flush_interval is not None:
+                now = time.monotonic()
+                if self.unwritten_time is None:
+                    self.unwritten_time = now
+                    self.flush_timer = threading.Timer(self.flush_interval, self.write_row_group)
+                    self.flush_timer.daemon = True
+                    self.flush_timer.start()
+                elif now - self.unwritten_time >= self.flush_interval:
+                    self.write_row_group()
+
+    def write_row_group(self):
+        """
+        Write the rows of the current row group to disk, replacing any partial row group
+        previously written. Each file is written to a temporary path and then renamed, so
+        that readers never see a truncated file.
+        """
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            self.unwritten_time = None
+            if self.row_count == self.written_row_count:
+                return
+
+            time_path, values_path = get_chunk_paths(self.path, self.row_group_index)
+            for path, array in [(time_path, self.times[:self.row_count]),
+                                (values_path, self.values[:, :self.row_count])]:
+                temp_path = path + ".tmp"
+                with open(temp_path, "wb") as fd:
+                    np.save(fd, array)
+                os.replace(temp_path, path)
+            logger.debug("DestinationNPY: Wrote %d rows to %s" % (self.row_count, values_path))
+            self.written_row_count = self.row_count
+
+    def flush(self):
+        """
+        Write the current row group to disk, and begin a new one.
+        """
+        with self.lock:
+            if self.row_count == 0:
+                return
+
+            self.write_row_group()
+            self.row_count = 0
+            self.written_row_count = 0
+            self.row_group_index += 1
+
+    def close(self):
+        self.flush()
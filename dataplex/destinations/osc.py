@@ -1,27 +1,102 @@
 import time
+import struct
+from typing import Optional
 from pythonosc.udp_client import SimpleUDPClient
+from pythonosc.parsing import osc_types
 
 from .destination import Destination
+from .delta import DeltaFilter
+
+#--------------------------------------------------------------
+# The default maximum bundle size, in bytes: a 1500-byte Ethernet
+# MTU, less IPv4 and UDP headers.
+#--------------------------------------------------------------
+DEFAULT_MTU = 1472
+
+BUNDLE_HEADER = b"#bundle\x00"
+
+class Datagram:
+    """
+    A pre-encoded OSC packet, which can be passed to SimpleUDPClient.send().
+    """
+    __slots__ = ["dgram"]
+
+    def __init__(self, dgram: bytes):
+        self.dgram = dgram
 
 class DestinationOSC (Destination):
-    def __init__(self, host, port, prefix = "/data/"):
+    def __init__(self,
+                 host,
+                 port,
+                 prefix = "/data/",
+                 property_names: list[str] = None,
+                 bundle: bool = False,
+                 mtu: int = DEFAULT_MTU,
+                 delta: Optional[DeltaFilter] = None):
+        """
+        Send data over Open Sound Control.
+
+        Args:
+            host (str): The host to send to.
+            port (int): The port to send to.
+            prefix (str, optional): The prefix for each OSC address. Defaults to "/data/".
+            property_names (list[str], optional): The properties to be sent, whose addresses are
+                                                  precomputed. Any other properties are cached on
+                                                  first use.
+            bundle (bool, optional): If True, each frame is sent as a single OSC bundle, timetagged
+                                     with the frame's time, so that receivers get atomic frames.
+                                     Defaults to False.
+            mtu (int, optional): In bundle mode, the maximum size of each bundle in bytes. Frames
+                                 exceeding this size are split across multiple bundles with the
+                                 same timetag. Defaults to 1472.
+            delta (DeltaFilter, optional): If specified, send only the properties that have changed
+                                           beyond their epsilon, plus periodic full-state keyframes.
+        """
         self.host = host
         self.port = port
         self.prefix = prefix
+        self.bundle = bundle
+        self.mtu = mtu
+        self.delta = delta
 
         self.osc_client = SimpleUDPClient(host, port)
 
+        #--------------------------------------------------------------
+        # Cache of OSC address strings, plus their OSC-encoded form
+        # for bundle mode.
+        #--------------------------------------------------------------
+        self.addresses = {}
+        self.encoded_addresses = {}
+        for name in ["time"] + (property_names or []):
+            self.get_address(name)
+
     def __str__(self):
         return "OSC (%s:%d)" % (self.host, self.port)
 
+    def get_address(self, name: str) -> str:
+        try:
+            return self.addresses[name]
+        except KeyError:
+            address = "%s%s" % (self.prefix, name)
+            self.addresses[name] = address
+            self.encoded_addresses[name] = osc_types.write_string(address)
+            return address
+
     def send_message(self, address, *args):
         self.osc_client.send_message(address, args)
 
     def send(self, data):
+        if self.delta:
+            data, _ = self.delta.filter(data)
+
+        if self.bundle:
+            self.send_bundle(data)
+            return
+
         #--------------------------------------------------------------
-        # first, send current time in hours and minutes 
+        # first, send current time in hours and minutes
         #--------------------------------------------------------------
-        self.send_message("%stime" % self.prefix, int(data["time"].timestamp()))
+        self.send_message(self.get_address("time"), int(data["time"].timestamp()))
 
         for name, record in list(data.items()):
             if name == "time":
@@ -35,15 +110,52 @@ class DestinationOSC (Destination):
             # if settings.use_peak[name]:
             #    value = self.data_max[name]
 
-            try:
-                value = float(record)
-
-                if value is not None:
-                    self.send_message("%s%s" % (self.prefix, name), value, value)
-            except IndexError:
+            if record is None:
                 #------------------------------------------------------------------------
                 # haven't yet got any data for this field (might not have read
                 # anything yet)
                 #------------------------------------------------------------------------
-                pass
+                continue
 
+            try:
+                value = float(record)
+            except (TypeError, ValueError):
+                continue
+            self.send_message(self.get_address(name), value, value)
+
+    def send_bundle(self, data):
+        """
+        Send the frame as one or more timetagged OSC bundles, each no larger than the MTU.
+        Messages have the same addresses and arguments as in non-bundle mode.
+        """
+        timestamp = data["time"].timestamp()
+        header = BUNDLE_HEADER + osc_types.write_date(timestamp)
+
+        messages = [self.encoded_addresses["time"] + b",i\x00\x00" + struct.pack(">i", int(timestamp))]
+        for name, record in data.items():
+            if name == "time" or record is None:
+                continue
+            try:
+                value = float(record)
+            except (TypeError, ValueError):
+                continue
+            if name not in self.encoded_addresses:
+                self.get_address(name)
+            messages.append(self.encoded_addresses[name] + b",ff\x00" + struct.pack(">ff", value, value))
+
+        #--------------------------------------------------------------
+        # Pack messages into bundles, each prefixed by its int32 size.
+        # A message that alone exceeds the MTU is sent in its own bundle.
+        #--------------------------------------------------------------
+        elements = [header]
+        size = len(header)
+        for message in messages:
+            element_size = 4 + len(message)
+            if size + element_size > self.mtu and len(elements) > 1:
+                self.osc_client.send(Datagram(b"".join(elements)))
+                elements = [header]
+                size = len(header)
+            elements.append(struct.pack(">i", len(message)))
+            elements.append(message)
+            size += element_size
+        self.osc_client.send(Datagram(b"".join(elements)))
@@ -0,0 +1,185 @@
+import time
+import logging
+import threading
+from collections import deque
+
+from .destination import Destination
+
+logger = logging.getLogger(__name__)
+
+QUEUE_POLICIES = ["block", "drop_oldest", "coalesce"]
+
+class QueuedDestination (Destination):
+    def __init__(self,
+                 destination: Destination,
+                 policy: str = "block",
+                 max_size: int = 16):
+        """
+        Wraps a Destination so that its send() runs on a dedicated worker thread, behind
+        a bounded queue. A slow or blocked destination then only delays itself, rather
+        than stalling the main loop and every other destination.
+
+        Args:
+            destination (Destination): The destination to wrap.
+            policy (str, optional): The behaviour when the queue is full:
+                                     - block: wait until there is space in the queue
+                                     - drop_oldest: discard the oldest queued record
+                                     - coalesce: keep only the latest record, discarding any
+                                       record that has not yet been sent
+                                    Defaults to "block".
+            max_size (int, optional): The maximum number of queued records. Defaults to 16.
+                                      Ignored for the coalesce policy, which holds a single record.
+        """
+        if policy not in QUEUE_POLICIES:
+            raise ValueError("Queue policy not known: %s (must be one of %s)" % (policy, ", ".join(QUEUE_POLICIES)))
+        if max_size < 1:
+            raise ValueError("Queue max_size must be at least 1")
+
+        self.destination = destination
+        self.policy = policy
+        self.max_size = 1 if policy == "coalesce" else max_size
+
+        self.queue = deque()
+        self.condition = threading.Condition()
+        self.running = True
+
+        #--------------------------------------------------------------
+        # Metrics
+        #--------------------------------------------------------------
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.error_count = 0
+        self.last_send_latency = None
+        self.max_send_latency = None
+        self.total_send_latency = 0.0
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def __str__(self):
+        return "%s [queue: %s]" % (self.destination, self.policy)
+
+    def __getattr__(self, name):
+        #--------------------------------------------------------------
+        # Delegate any other attributes (e.g. DestinationMidi.add_mapping)
+        # to the wrapped destination.
+        #--------------------------------------------------------------
+        if name == "destination":
+            raise AttributeError(name)
+        return getattr(self.destination, name)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of records currently awaiting send.
+        """
+        return len(self.queue)
+
+    @property
+    def mean_send_latency(self) -> float:
+        """
+        The mean time, in seconds, between a record being queued and its send completing.
+        """
+        if self.sent_count == 0:
+            return None
+        return self.total_send_latency / self.sent_count
+
+    @property
+    def metrics(self) -> dict:
+        """
+        Returns:
+            dict: A snapshot of the queue's metrics.
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "sent_count": self.sent_count,
+            "dropped_count": self.dropped_count,
+            "error_count": self.error_count,
+            "last_send_latency": self.last_send_latency,
+            "mean_send_latency": self.mean_send_latency,
+            "max_send_latency": self.max_send_latency,
+        }
+
+    def send(self, data: dict):
+        #--------------------------------------------------------------
+        # Take a copy of the record (and, for a Frame, its sample
+        # metadata), as the caller reuses its data dict on the next
+        # iteration. Each item holds the events triggered by its record,
+        # added by send_events().
+        #--------------------------------------------------------------
+        item = [time.monotonic(), data.copy(), []]
+
+        with self.condition:
+            if len(self.queue) >= self.max_size:
+                if self.policy == "block":
+                    while len(self.queue) >= self.max_size and self.running:
+                        self.condition.wait()
+                else:
+                    #--------------------------------------------------------------
+                    # Events of a dropped record are sent with the next record.
+                    #--------------------------------------------------------------
+                    _, _, events = self.queue.popleft()
+                    item[2] = events
+                    self.dropped_count += 1
+            self.queue.append(item)
+            self.condition.notify_all()
+
+    def send_events(self, events: list):
+        #--------------------------------------------------------------
+        # Events are sent by the worker thread after the record that
+        # triggered them. If the worker has already taken the record,
+        # they are queued on their own.
+        #--------------------------------------------------------------
+        with self.condition:
+            if self.queue:
+                self.queue[-1][2].extend(events)
+            else:
+                self.queue.append([time.monotonic(), None, list(events)])
+                self.condition.notify_all()
+
+    def run(self):
+        """
+        Worker loop, sending each queued record and its events to the wrapped destination.
+        """
+        while True:
+            with self.condition:
+                while not self.queue and self.running:
+                    self.condition.wait()
+                if not self.queue:
+                    return
+                queued_time, data, events = self.queue.popleft()
+                self.condition.notify_all()
+
+            if data is not None:
+                try:
+                    self.destination.send(data)
+                except Exception as e:
+                    self.error_count += 1
+                    logger.warning("QueuedDestination: Error sending to %s: %s" % (self.destination, e))
+                else:
+                    latency = time.monotonic() - queued_time
+                    self.sent_count += 1
+                    self.last_send_latency = latency
+                    self.total_send_latency += latency
+                    if self.max_send_latency is None or latency > self.max_send_latency:
+                        self.max_send_latency = latency
+
+            if events:
+                try:
+                    self.destination.send_events(events)
+                except Exception as e:
+                    self.error_count += 1
+                    logger.warning("QueuedDestination: Error sending events to %s: %s" % (self.destination, e))
+
+    def close(self):
+        """
+        Send any records remaining in the queue, stop the worker thread, and close
+        the wrapped destination.
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+
+        if hasattr(self.destination, "close"):
+            self.destination.close()
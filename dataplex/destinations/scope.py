@@ -1,9 +1,20 @@
 from jdp import JDPClient
+from typing import Optional
 
 from .destination import Destination
+from .delta import DeltaFilter
 
 class DestinationScope (Destination):
-    def __init__(self, property_names: list[str]):
+    def __init__(self, property_names: list[str], delta: Optional[DeltaFilter] = None):
+        """
+        Plot data in a JDP scope running on localhost.
+
+        Args:
+            property_names (list[str]): The properties to plot.
+            delta (DeltaFilter, optional): If specified, send only the properties that have changed
+                                           beyond their epsilon, plus periodic full-state keyframes.
+        """
+        self.delta = delta
         self.client = JDPClient("127.0.0.1", 48000)
         self.property_names = property_names
 
@@ -19,9 +30,12 @@ class DestinationScope (Destination):
         self.client.send({"config": config})
 
     def send(self, data):
+        if self.delta:
+            data, _ = self.delta.filter(data)
+
         message = {}
         for property, value in data.items():
             if property in self.property_names:
                 message[property] = value
 
-        self.client.send({"data": message})
\ No newline at end of file
+        self.client.send({"data": message})
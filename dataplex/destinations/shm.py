@@ -0,0 +1,195 @@
+import json
+import time
+import struct
+import logging
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+from .destination import Destination
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHM_NAME = "dataplex"
+
+#--------------------------------------------------------------
+# Layout of the shared memory segment:
+#  - header (64 bytes):
+#     - magic (8 bytes)
+#     - version, property count, ring size, schema length (uint32 each)
+#     - sequence (uint64): a seqlock counter, which is odd while a frame
+#       is being written
+#     - frame count (uint64): the total number of frames written
+#  - schema: JSON list of property names, padded to 8 bytes
+#  - frames: ring_size rows of float64, each comprising the frame's
+#    time (as a UNIX timestamp) followed by each property's value
+#--------------------------------------------------------------
+SHM_MAGIC = b"DPLXSHM1"
+SHM_VERSION = 1
+SHM_HEADER_FORMAT = "<8sIIII"
+SHM_HEADER_SIZE = 64
+SHM_COUNTERS_OFFSET = 24
+
+class DestinationSharedMemory (Destination):
+    def __init__(self,
+                 property_names: list[str],
+                 name: str = DEFAULT_SHM_NAME,
+                 ring_size: int = 1):
+        """
+        Publish frames into a shared memory segment, for zero-serialisation hand-off to
+        consumers on the same host. Consumers read frames with SharedMemoryReader.
+
+        Args:
+            property_names (list[str]): The properties to publish, which define the frame layout.
+            name (str, optional): The name of the shared memory segment. Defaults to "dataplex".
+            ring_size (int, optional): The number of recent frames to retain. Defaults to 1
+                                       (the latest frame only).
+        """
+        self.property_names = list(property_names)
+        self.name = name
+        self.ring_size = ring_size
+
+        schema = json.dumps(self.property_names).encode()
+        schema_length = (len(schema) + 7) // 8 * 8
+        frames_offset = SHM_HEADER_SIZE + schema_length
+        frame_length = 1 + len(self.property_names)
+        size = frames_offset + ring_size * frame_length * 8
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            #--------------------------------------------------------------
+            # Replace a segment left behind by a previous process.
+            #--------------------------------------------------------------
+            logger.warning("DestinationSharedMemory: Replacing existing segment: %s" % name)
+            existing = shared_memory.SharedMemory(name=name)
+            existing.close()
+            existing.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        buffer = self.shm.buf
+        struct.pack_into(SHM_HEADER_FORMAT, buffer, 0, SHM_MAGIC, SHM_VERSION,
+                         len(self.property_names), ring_size, schema_length)
+        buffer[SHM_HEADER_SIZE:SHM_HEADER_SIZE + len(schema)] = schema
+        self.counters = np.ndarray((2,), dtype=np.uint64, buffer=buffer, offset=SHM_COUNTERS_OFFSET)
+        self.frames = np.ndarray((ring_size, frame_length), dtype=np.float64, buffer=buffer, offset=frames_offset)
+        self.counters[:] = 0
+        self.frames[:] = np.nan
+
+        self.frame = np.zeros(frame_length)
+
+    def __str__(self):
+        return "Shared memory (%s)" % self.name
+
+    def send(self, data: dict):
+        frame = self.frame
+        frame[0] = data["time"].timestamp()
+        for index, key in enumerate(self.property_names, 1):
+            value = data[key]
+            frame[index] = np.nan if value is None else value
+
+        #--------------------------------------------------------------
+        # Seqlock write: readers retry if the sequence number is odd,
+        # or changes during their read.
+        #--------------------------------------------------------------
+        frame_count = int(self.counters[1])
+        self.counters[0] += 1
+        self.frames[frame_count % self.ring_size] = frame
+        self.counters[1] = frame_count + 1
+        self.counters[0] += 1
+
+    def close(self):
+        #--------------------------------------------------------------
+        # Release views onto the buffer before closing.
+        #--------------------------------------------------------------
+        del self.counters
+        del self.frames
+        self.shm.close()
+        self.shm.unlink()
+
+class SharedMemoryReader:
+    def __init__(self, name: str = DEFAULT_SHM_NAME):
+        """
+        Read frames published by DestinationSharedMemory, without blocking the writer.
+
+        Usage:
+            reader = SharedMemoryReader("dataplex")
+            frame = reader.read()
+            print(frame["temperature"])
+
+        Args:
+            name (str, optional): The name of the shared memory segment. Defaults to "dataplex".
+        """
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            #--------------------------------------------------------------
+            # Prior to Python 3.13, attaching registers the segment with the
+            # resource tracker, which would unlink it when the reader exits.
+            #--------------------------------------------------------------
+            self.shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+
+        buffer = self.shm.buf
+        magic, version, property_count, ring_size, schema_length = struct.unpack_from(SHM_HEADER_FORMAT, buffer, 0)
+        if magic != SHM_MAGIC or version != SHM_VERSION:
+            raise ValueError("Shared memory segment %s is not a dataplex segment" % name)
+
+        schema = bytes(buffer[SHM_HEADER_SIZE:SHM_HEADER_SIZE + schema_length]).rstrip(b"\x00")
+        self.property_names = json.loads(schema)
+        self.ring_size = ring_size
+        self.counters = np.ndarray((2,), dtype=np.uint64, buffer=buffer, offset=SHM_COUNTERS_OFFSET)
+        self.frames = np.ndarray((ring_size, 1 + property_count), dtype=np.float64, buffer=buffer,
+                                 offset=SHM_HEADER_SIZE + schema_length)
+
+    @property
+    def frame_count(self) -> int:
+        """
+        The total number of frames published. Readers can poll this to detect new frames.
+        """
+        return int(self.counters[1])
+
+    def read_frames(self, count: int = 1) -> np.ndarray:
+        """
+        Read the most recent frames as an array.
+
+        Args:
+            count (int, optional): The number of frames to read, up to the ring size. Defaults to 1.
+
+        Returns:
+            np.ndarray: An array of shape (count, 1 + property_count), oldest first. Column 0 is the
+                        frame time as a UNIX timestamp, followed by each property in property_names order.
+                        Fewer rows are returned if fewer frames have been published.
+        """
+        count = min(count, self.ring_size)
+        while True:
+            sequence = int(self.counters[0])
+            if sequence % 2 == 1:
+                time.sleep(0)
+                continue
+            frame_count = int(self.counters[1])
+            indices = np.arange(max(frame_count - count, 0), frame_count) % self.ring_size
+            frames = self.frames[indices]
+            if int(self.counters[0]) == sequence:
+                return frames
+
+    def read(self) -> dict:
+        """
+        Read the latest frame.
+
+        Returns:
+            dict: The latest frame, keyed by property name, plus a "time" UNIX timestamp.
+                  None if no frames have been published.
+        """
+        frames = self.read_frames(1)
+        if len(frames) == 0:
+            return None
+        frame = frames[0]
+        data = {"time": float(frame[0])}
+        for index, property_name in enumerate(self.property_names, 1):
+            data[property_name] = float(frame[index])
+        return data
+
+    def close(self):
+        del self.counters
+        del self.frames
+        self.shm.close()
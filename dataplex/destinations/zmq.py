@@ -3,9 +3,12 @@ from zeroconf import Zeroconf, ServiceInfo
 import socket
 import zmq
 import time
+import datetime
+from typing import Optional
 
 from .destination import Destination
-from ..utils import serialise_data
+from .delta import DeltaFilter
+from ..wire import FrameEncoder, DEFAULT_ENCODING
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +30,25 @@ def get_local_ip():
 
 class DestinationZMQ (Destination):
     def __init__(self,
-                 property_names: list[str] = None):
+                 property_names: list[str] = None,
+                 encoding: str = DEFAULT_ENCODING,
+                 delta: Optional[DeltaFilter] = None):
+        """
+        Publish data over ZeroMQ, advertised via Zeroconf.
+
+        Args:
+            property_names (list[str], optional): The properties to publish.
+            encoding (str, optional): The wire encoding: "json", "struct" (a packed float64 array, with
+                                      a periodic schema message), or "msgpack". The encoding is
+                                      advertised via Zeroconf, and detected automatically by
+                                      SourceZMQ. Only use "struct" or "msgpack" if all consumers
+                                      support them. Defaults to "json".
+            delta (DeltaFilter, optional): If specified, send only the properties that have changed
+                                           beyond their epsilon, plus periodic full-state keyframes.
+        """
         self.property_names = property_names
+        self.delta = delta
+        self.encoder = FrameEncoder(encoding, property_names=property_names)
         public_ip = get_local_ip()
         logger.info(f"Detected LAN IP: {public_ip}")
 
@@ -47,14 +67,22 @@ class DestinationZMQ (Destination):
                                    name=SERVICE_NAME,
                                    addresses=[socket.inet_aton(public_ip)],
                                    port=PUB_PORT,
-                                   properties={"topics": "temp,humidity,wind"},
+                                   properties={"topics": "temp,humidity,wind",
+                                               "encoding": encoding},
                                    server=f"{socket.gethostname()}.local.")
         self.zeroconf.register_service(self.service)
         logger.info(f"Service advertised via Zeroconf at {public_ip}:{PUB_PORT}")
 
+    def __str__(self):
+        return "ZMQ (port %d, %s)" % (PUB_PORT, self.encoder.encoding)
+
     def send(self, data):
-        data = serialise_data(data)
-        self.pub.send_json(data)
+        keyframe = True
+        if self.delta:
+            data, keyframe = self.delta.filter(data)
+
+        for message in self.encoder.encode(data, keyframe=keyframe):
+            self.pub.send_multipart(message)
 
     def close(self):
         self.zeroconf.unregister_service(self.service)
@@ -66,7 +94,7 @@ if __name__ == "__main__":
     destination = DestinationZMQ()
     try:
         while True:
-            data = {"temp": 22.3, "humidity": 0.54, "wind": 3.5}
+            data = {"time": datetime.datetime.now(), "temp": 22.3, "humidity": 0.54, "wind": 3.5}
             destination.send(data)
             logger.info(f"DestinationZMQ: Sent: {data}")
             time.sleep(1)
@@ -0,0 +1,120 @@
+import time
+import itertools
+from typing import Iterable, Optional
+
+#--------------------------------------------------------------
+# Tick numbers are unique across all frames in the process, so
+# that a tick identifies a frame's contents at one point in time.
+#--------------------------------------------------------------
+tick_counter = itertools.count(1)
+
+class Frame (dict):
+    """
+    The current frame of data: a dict of the latest value of each property, plus its "time".
+
+    Frame is allocated once, with a fixed index of required properties built at init, and is
+    updated in place on each tick rather than rebuilt. As a dict subclass, it can be written
+    (with dict.update) and read by destinations, callbacks and rolling buffers at native dict
+    speed.
+
+    A required property is missing if its value is None. Whether the frame is complete is
+    checked with a single scan of its values in C, and only if any value is None are the
+    required properties examined individually.
+
+    Alongside its values, a frame carries metadata on each sample, for destinations that
+    need it:
+     - sample_times: the arrival time of each property's latest sample, as a UNIX timestamp
+     - sequence_numbers: a per-property counter, which increases with each new sample, so
+       that consumers can skip samples that they have already processed
+     - source_sample_times: the arrival time of each source's latest sample, keyed by source name
+     - stale_property_names: the properties whose latest sample is older than their source's
+       stale_after, and whose values have been held, nulled or interpolated
+     - tick: a number identifying the frame's contents, updated by next_tick() each time the
+       frame is updated, so that consumers can cache results per tick (see FrameSerialiser)
+    """
+    __slots__ = ["property_names", "property_index", "sample_times", "sequence_numbers",
+                 "source_sample_times", "stale_property_names", "tick"]
+
+    def __init__(self, property_names: Iterable[str] = ()):
+        super().__init__()
+        self.property_names = []
+        self.property_index = {}
+        self.sample_times = {}
+        self.sequence_numbers = {}
+        self.source_sample_times = {}
+        self.stale_property_names = frozenset()
+        self.tick = None
+        self["time"] = None
+        for name in property_names:
+            self.add_property(name)
+
+    def add_property(self, name: str):
+        """
+        Add a required property, initially with no value.
+        """
+        if name in self.property_index:
+            return
+        self.property_index[name] = len(self.property_names)
+        self.property_names.append(name)
+        self[name] = None
+
+    def copy(self) -> "Frame":
+        """
+        Returns:
+            Frame: A snapshot of the frame's values and metadata, which is not modified
+                   by subsequent ticks.
+        """
+        frame = Frame.__new__(Frame)
+        dict.update(frame, self)
+        frame.property_names = self.property_names
+        frame.property_index = self.property_index
+        frame.sample_times = dict(self.sample_times)
+        frame.sequence_numbers = dict(self.sequence_numbers)
+        frame.source_sample_times = dict(self.source_sample_times)
+        frame.stale_property_names = self.stale_property_names
+        frame.tick = self.tick
+        return frame
+
+    def next_tick(self):
+        """
+        Mark the frame's contents as changed. Called before the frame is updated on each tick.
+        """
+        self.tick = next(tick_counter)
+
+    def __reduce__(self):
+        #--------------------------------------------------------------
+        # Pickle (e.g. for multiprocessing) as a plain dict.
+        #--------------------------------------------------------------
+        return (dict, (dict(self),))
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        True if every required property holds a value.
+        """
+        if None not in self.values():
+            return True
+        return not self.missing_property_names
+
+    @property
+    def missing_property_names(self) -> list[str]:
+        """
+        The names of required properties that do not yet hold a value.
+        """
+        return [name for name in self.property_names if self[name] is None]
+
+    def get_source_age(self, source_name: str) -> Optional[float]:
+        """
+        Get the freshness of a source.
+
+        Args:
+            source_name (str): The name of the source.
+
+        Returns:
+            float: The time since the source's latest sample arrived, in seconds, or None
+                   if no sample has arrived.
+        """
+        sample_time = self.source_sample_times.get(source_name)
+        if sample_time is None:
+            return None
+        return time.time() - sample_time
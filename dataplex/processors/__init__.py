@@ -1,2 +1,4 @@
 from .smooth import ProcessorSmooth
-from .normalise import ProcessorECDFNormalise, ProcessorLinearNormalise
\ No newline at end of file
+from .normalise import ProcessorECDFNormalise, ProcessorLinearNormalise
+from .events import ThresholdEventDetector, ThresholdEvent
+from .resample import Resampler
@@ -1,3 +1,27 @@
+import numpy as np
+
 class Processor:
     def __init__(self):
         pass
+
+    def process_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Process an array of values, returning an array of results identical to calling
+        process() on each value in turn. Missing values should be given as NaN, and are
+        returned as NaN.
+
+        Subclasses may override this with a vectorised implementation.
+
+        Args:
+            values (np.ndarray): The values to process.
+
+        Returns:
+            np.ndarray: The processed values.
+        """
+        output = np.full(len(values), np.nan)
+        for index, value in enumerate(values):
+            if not np.isnan(value):
+                result = self.process(float(value))
+                if result is not None:
+                    output[index] = result
+        return output
@@ -0,0 +1,184 @@
+import time
+import datetime
+import numpy as np
+from typing import Any, Optional
+
+DIRECTIONS = ["up", "down", "both"]
+
+class ThresholdEvent:
+    """
+    An event triggered by a property's value crossing a threshold.
+
+    Attributes:
+        property (str): The name of the property.
+        threshold (float): The threshold that was crossed.
+        direction (str): The direction of the crossing: "up" or "down".
+        value (float): The value of the property that triggered the event.
+        time (datetime.datetime): The time of the frame that triggered the event.
+        payload: The payload passed to add_threshold(), used by destinations to decide how to
+                 render the event (e.g. the MIDI note to play).
+    """
+    __slots__ = ["property", "threshold", "direction", "value", "time", "payload"]
+
+    def __init__(self, property: str, threshold: float, direction: str, value: float,
+                 time: Optional[datetime.datetime], payload: Any = None):
+        self.property = property
+        self.threshold = threshold
+        self.direction = direction
+        self.value = value
+        self.time = time
+        self.payload = payload
+
+    def __repr__(self):
+        return "ThresholdEvent(%s %s %s, value=%s)" % (self.property, self.direction, self.threshold, self.value)
+
+class PropertyThresholds:
+    def __init__(self):
+        """
+        The thresholds registered for a single property, held as parallel lists until compiled
+        into NumPy arrays for vectorised evaluation.
+        """
+        self.thresholds = []
+        self.hysteresis = []
+        self.debounce_times = []
+        self.directions = []
+        self.payloads = []
+        self.compiled = False
+
+    def add(self, threshold: float, direction: str, hysteresis: float, debounce_time: float, payload: Any):
+        self.thresholds.append(threshold)
+        self.directions.append(direction)
+        self.hysteresis.append(hysteresis)
+        self.debounce_times.append(debounce_time)
+        self.payloads.append(payload)
+        self.compiled = False
+
+    def compile(self):
+        self.threshold_array = np.array(self.thresholds, dtype=np.float64)
+        self.hysteresis_array = np.array(self.hysteresis, dtype=np.float64)
+        self.debounce_array = np.array(self.debounce_times, dtype=np.float64)
+        self.detect_up = np.array([direction in ("up", "both") for direction in self.directions])
+        self.detect_down = np.array([direction in ("down", "both") for direction in self.directions])
+
+        #--------------------------------------------------------------
+        # armed_up/armed_down are True once the value has moved far
+        # enough below/above the threshold (by its hysteresis) for a
+        # subsequent crossing to trigger. They are initialised from
+        # the first value seen.
+        #--------------------------------------------------------------
+        self.armed_up = None
+        self.armed_down = None
+        self.last_triggered = np.full(len(self.thresholds), -np.inf)
+        self.compiled = True
+
+    def process(self, value: float, timestamp: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate all thresholds against a new value.
+
+        Returns:
+            tuple: A tuple of (indices of triggered thresholds, boolean array of which were upward crossings).
+        """
+        if not self.compiled:
+            self.compile()
+
+        thresholds = self.threshold_array
+        above = value >= thresholds
+        below = value <= thresholds
+        if self.armed_up is None:
+            self.armed_up = ~above
+            self.armed_down = ~below
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=bool)
+
+        up = self.armed_up & above & self.detect_up
+        down = self.armed_down & below & self.detect_down
+        crossed = up | down
+        if crossed.any():
+            crossed &= (timestamp - self.last_triggered) >= self.debounce_array
+            self.last_triggered[crossed] = timestamp
+
+        #--------------------------------------------------------------
+        # A crossing disarms its threshold (even if debounced), which
+        # re-arms once the value has passed back beyond the hysteresis band.
+        #--------------------------------------------------------------
+        self.armed_up = (self.armed_up & ~above) | (value < thresholds - self.hysteresis_array)
+        self.armed_down = (self.armed_down & ~below) | (value > thresholds + self.hysteresis_array)
+
+        indices = np.flatnonzero(crossed)
+        return indices, up[indices]
+
+class ThresholdEventDetector:
+    def __init__(self):
+        """
+        Detects threshold crossings across any number of properties and thresholds.
+
+        All thresholds registered for a property are compiled into NumPy arrays, so that each
+        frame is evaluated in a single vectorised pass per property, rather than one tracker
+        at a time. Events are returned as ThresholdEvent objects, which Dataplex passes to
+        each destination's send_events() method.
+
+        Usage:
+            detector = ThresholdEventDetector()
+            detector.add_threshold("wind_speed", 10.0, direction="up", hysteresis=1.0)
+            events = detector.process(data)
+        """
+        self.properties = {}
+
+    def add_threshold(self,
+                      property: str,
+                      threshold: float,
+                      direction: str = "both",
+                      hysteresis: float = 0.0,
+                      debounce_time: float = 0.0,
+                      payload: Any = None):
+        """
+        Register a threshold.
+
+        Args:
+            property (str): The property to track.
+            threshold (float): The threshold value.
+            direction (str, optional): Trigger on upward crossings ("up"), downward crossings ("down"),
+                                       or both ("both"). Defaults to "both".
+            hysteresis (float, optional): After triggering, the distance the value must move back
+                                          past the threshold before it can trigger again, to suppress
+                                          repeated triggers from noise. Defaults to 0.0.
+            debounce_time (float, optional): The minimum interval between triggers, in seconds.
+                                             Defaults to 0.0.
+            payload (optional): An arbitrary object attached to each resultant event.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError("Direction not known: %s (must be one of %s)" % (direction, ", ".join(DIRECTIONS)))
+        if property not in self.properties:
+            self.properties[property] = PropertyThresholds()
+        self.properties[property].add(threshold, direction, hysteresis, debounce_time, payload)
+
+    def process(self, data: dict) -> list[ThresholdEvent]:
+        """
+        Evaluate all thresholds against a frame.
+
+        Args:
+            data (dict): The frame. If it has a "time" property, this is used for debouncing, so that
+                         debounce times are respected when replaying logs faster than realtime.
+
+        Returns:
+            list[ThresholdEvent]: The events triggered by this frame.
+        """
+        frame_time = data.get("time")
+        if isinstance(frame_time, datetime.datetime):
+            timestamp = frame_time.timestamp()
+        else:
+            timestamp = time.monotonic()
+
+        events = []
+        for property, thresholds in self.properties.items():
+            value = data.get(property)
+            if value is None or value != value:
+                continue
+            indices, upward = thresholds.process(value, timestamp)
+            for index, is_upward in zip(indices.tolist(), upward.tolist()):
+                events.append(ThresholdEvent(property=property,
+                                             threshold=thresholds.thresholds[index],
+                                             direction="up" if is_upward else "down",
+                                             value=value,
+                                             time=frame_time,
+                                             payload=thresholds.payloads[index]))
+        return events
@@ -1,4 +1,7 @@
 import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+import numpy as np
 
 from ..base import Processor
 
@@ -26,24 +29,149 @@ def ecdf(distribution, sample):
 
                 return n_frac
 
+class IncrementalECDF:
+    """
+    Maintains a sliding window of values in sorted order, so that the percentile position
+    of a sample can be found by binary search rather than by sorting the full history.
+
+    Returns identical results to ecdf(history, sample), where history is the window of
+    the most recent max_size values.
+    """
+
+    def __init__(self, max_size: int = sys.maxsize):
+        self.max_size = max_size
+        self.history = deque()
+        self.sorted_values = []
+
+    def __len__(self):
+        return len(self.history)
+
+    def add(self, value):
+        """
+        Add a value to the window, evicting the oldest value if the window is full.
+        """
+        self.history.append(value)
+        insort(self.sorted_values, value)
+        if len(self.history) > self.max_size:
+            oldest = self.history.popleft()
+            del self.sorted_values[bisect_left(self.sorted_values, oldest)]
+
+    def query(self, sample):
+        """
+        Returns the percentile position of sample within the window, with linear
+        interpolation between data points.
+        """
+        distribution = self.sorted_values
+
+        if len(distribution) == 0:
+            return 0.5
+        elif sample <= distribution[0]:
+            return 0.0
+        elif sample >= distribution[-1]:
+            return 1.0
+        else:
+            n = bisect_right(distribution, sample)
+            lerp = (sample - distribution[n - 1]) / float(distribution[n] - distribution[n - 1])
+            n_frac = ((n - 1) + lerp) / (len(distribution) - 1)
+
+            return n_frac
+
+    def query_and_add_batch(self, samples: np.ndarray, chunk_size: int = 256) -> np.ndarray:
+        """
+        Equivalent to calling query() then add() for each sample in turn, vectorised by rank.
+
+        Samples are processed in chunks. Within each chunk, each sample's rank among the
+        sorted window is found by binary search, and its rank among the preceding samples
+        of the chunk by a lower-triangular comparison matrix. The chunk is then merged into
+        the sorted window.
+
+        Only valid if the window does not overflow max_size, as values are not evicted.
+
+        Args:
+            samples (np.ndarray): The samples, which must not contain NaN.
+            chunk_size (int, optional): The number of samples to process per chunk.
+
+        Returns:
+            np.ndarray: The percentile position of each sample.
+        """
+        assert len(self.history) + len(samples) <= self.max_size, "Window would overflow max_size"
+
+        window = np.array(self.sorted_values, dtype=np.float64)
+        output = np.empty(len(samples))
+
+        for start in range(0, len(samples), chunk_size):
+            chunk = samples[start:start + chunk_size]
+            count = len(chunk)
+
+            #--------------------------------------------------------------
+            # preceding[j, i] is True for each chunk value i that precedes
+            # sample j, and so is part of j's distribution.
+            #--------------------------------------------------------------
+            preceding = np.tri(count, count, -1, dtype=bool)
+            less_equal = preceding & (chunk[np.newaxis, :] <= chunk[:, np.newaxis])
+            greater = preceding & ~less_equal
+
+            window_rank = np.searchsorted(window, chunk, side="right")
+            rank = window_rank + less_equal.sum(axis=1)
+            size = len(window) + np.arange(count)
+
+            #--------------------------------------------------------------
+            # The nearest values below (or equal to) and above each sample.
+            #--------------------------------------------------------------
+            if len(window):
+                window_lower = np.where(window_rank > 0, window[np.maximum(window_rank - 1, 0)], -np.inf)
+                window_upper = np.where(window_rank < len(window), window[np.minimum(window_rank, len(window) - 1)], np.inf)
+            else:
+                window_lower = np.full(count, -np.inf)
+                window_upper = np.full(count, np.inf)
+            lower = np.maximum(window_lower, np.where(less_equal, chunk[np.newaxis, :], -np.inf).max(axis=1))
+            upper = np.minimum(window_upper, np.where(greater, chunk[np.newaxis, :], np.inf).min(axis=1))
+
+            #--------------------------------------------------------------
+            # The extremes of each sample's distribution.
+            #--------------------------------------------------------------
+            chunk_min = np.concatenate(([np.inf], np.minimum.accumulate(chunk)[:-1]))
+            chunk_max = np.concatenate(([-np.inf], np.maximum.accumulate(chunk)[:-1]))
+            if len(window):
+                chunk_min = np.minimum(chunk_min, window[0])
+                chunk_max = np.maximum(chunk_max, window[-1])
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                lerp = (chunk - lower) / (upper - lower)
+                n_frac = ((rank - 1) + lerp) / (size - 1)
+            result = np.select([size == 0, chunk <= chunk_min, chunk >= chunk_max],
+                               [0.5, 0.0, 1.0],
+                               n_frac)
+            output[start:start + count] = result
+
+            sorted_chunk = np.sort(chunk)
+            window = np.insert(window, np.searchsorted(window, sorted_chunk, side="right"), sorted_chunk)
+
+        self.history.extend(samples.tolist())
+        self.sorted_values = window.tolist()
+
+        return output
+
 class ProcessorECDFNormalise(Processor):
     def __init__(self, max_history_size=sys.maxsize):
         self.max_history_size = max_history_size
-        self.history = []
+        self.distribution = IncrementalECDF(max_history_size)
 
     def __len__(self):
-        return len(self.history)
+        return len(self.distribution)
+
+    @property
+    def history(self):
+        return self.distribution.history
 
     def process(self, value):
         if value is not None:
-            normalized = ecdf(self.history, value)
+            normalized = self.distribution.query(value)
             #--------------------------------------------------------------------------
-            # Whatever the type of our entities, add them to history, then
-            # crop history to the maximum specified histsize
+            # Whatever the type of our entities, add them to history, which
+            # is cropped to the maximum specified histsize
             #--------------------------------------------------------------------------
-            self.history.append(value)
-            while len(self.history) > self.max_history_size:
-                self.history.pop(0)
+            self.distribution.add(value)
 
             return normalized
 
@@ -53,6 +181,21 @@ class ProcessorECDFNormalise(Processor):
             #--------------------------------------------------------------------------
             return None
 
+    def process_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Normalise an array of values, using a vectorised rank-based method.
+        If the batch would overflow max_history_size, values are processed sequentially.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        samples = values[valid]
+        if len(self.distribution) + len(samples) > self.max_history_size:
+            return super().process_batch(values)
+
+        output = np.full(len(values), np.nan)
+        output[valid] = self.distribution.query_and_add_batch(samples)
+        return output
+
 class ClassNormaliser:
     """
     Records instances of a discrete set of values, and returns the
@@ -1,22 +1,55 @@
 from ..base import Processor
+from typing import Optional
+from collections import deque
+import numpy as np
+import time
 import sys
 
 class ProcessorLinearNormalise(Processor):
-    def __init__(self, max_history_size: int = sys.maxsize):
+    def __init__(self,
+                 max_history_size: int = sys.maxsize,
+                 windowed: bool = False,
+                 window_duration: Optional[float] = None):
+        """
+        Linearly normalise values to [0, 1], relative to the minimum and maximum values seen.
+
+        Args:
+            max_history_size (int, optional): The number of values to retain.
+            windowed (bool, optional): If True, the range is calculated over the last max_history_size
+                                       values, rather than over all values seen, so that it adapts
+                                       as the range of input values changes. Defaults to False.
+            window_duration (float, optional): If specified, the range is calculated over values
+                                               received within the last window_duration seconds.
+                                               Implies windowed=True.
+        """
         self.max_history_size = max_history_size
-        self.history = []
+        self.windowed = windowed or window_duration is not None
+        self.window_duration = window_duration
+        self.history = deque(maxlen=max_history_size)
         self.min_value = None
         self.max_value = None
 
+        #--------------------------------------------------------------
+        # In windowed mode, monotonic deques of (index, timestamp, value)
+        # candidates for the window minimum and maximum, so that each
+        # update is amortised O(1).
+        #--------------------------------------------------------------
+        self.min_candidates = deque()
+        self.max_candidates = deque()
+        self.index = 0
+
     def __len__(self):
         return len(self.history)
 
-    def process(self, value):
+    def process(self, value, timestamp: Optional[float] = None):
         if value is not None:
-            if self.max_value is None or value > self.max_value:
-                self.max_value = value
-            if self.min_value is None or value < self.min_value:
-                self.min_value = value
+            if self.windowed:
+                self.update_window(value, timestamp)
+            else:
+                if self.max_value is None or value > self.max_value:
+                    self.max_value = value
+                if self.min_value is None or value < self.min_value:
+                    self.min_value = value
 
             if (self.max_value - self.min_value) > 0:
                 normalized = (value - self.min_value) / (self.max_value - self.min_value)
@@ -24,7 +57,70 @@ class ProcessorLinearNormalise(Processor):
                 normalized = 0.5
 
             self.history.append(normalized)
-            if len(self.history) > self.max_history_size:
-                self.history.pop(0)
 
-            return normalized
\ No newline at end of file
+            return normalized
+
+    def process_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Normalise an array of values, using the cumulative minimum and maximum.
+        In windowed mode, values are processed sequentially.
+        """
+        if self.windowed:
+            return super().process_batch(values)
+
+        values = np.asarray(values, dtype=np.float64)
+        output = np.full(len(values), np.nan)
+        valid = ~np.isnan(values)
+        samples = values[valid]
+        if len(samples) == 0:
+            return output
+
+        max_values = np.maximum.accumulate(samples)
+        min_values = np.minimum.accumulate(samples)
+        if self.max_value is not None:
+            max_values = np.maximum(max_values, self.max_value)
+            min_values = np.minimum(min_values, self.min_value)
+
+        ranges = max_values - min_values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(ranges > 0, (samples - min_values) / ranges, 0.5)
+
+        self.max_value = float(max_values[-1])
+        self.min_value = float(min_values[-1])
+        self.history.extend(normalized.tolist())
+
+        output[valid] = normalized
+        return output
+
+    def update_window(self, value, timestamp: Optional[float] = None):
+        """
+        Add a value to the sliding window, and update min_value and max_value to
+        the window's extremes.
+
+        Args:
+            value: The new value.
+            timestamp (float, optional): The time of the value, in seconds. Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        while self.min_candidates and self.min_candidates[-1][2] >= value:
+            self.min_candidates.pop()
+        self.min_candidates.append((self.index, timestamp, value))
+        while self.max_candidates and self.max_candidates[-1][2] <= value:
+            self.max_candidates.pop()
+        self.max_candidates.append((self.index, timestamp, value))
+
+        #--------------------------------------------------------------
+        # Evict candidates that have fallen outside the window.
+        # The newest value is always retained.
+        #--------------------------------------------------------------
+        oldest_index = self.index - self.max_history_size + 1
+        oldest_timestamp = timestamp - self.window_duration if self.window_duration is not None else None
+        for candidates in (self.min_candidates, self.max_candidates):
+            while candidates[0][0] < oldest_index or (oldest_timestamp is not None and candidates[0][1] < oldest_timestamp):
+                candidates.popleft()
+
+        self.min_value = self.min_candidates[0][2]
+        self.max_value = self.max_candidates[0][2]
+        self.index += 1
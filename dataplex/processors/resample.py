@@ -0,0 +1,229 @@
+import threading
+import numpy as np
+from typing import Optional
+
+MODES = ["hold", "linear", "mean"]
+
+class SampleHistory:
+    def __init__(self, max_size: int, decimate: int = 1):
+        """
+        A short history of timestamped samples of a single property, stored in a pair of
+        float64 arrays with twice max_size capacity. Samples are appended until the end of
+        storage is reached, when the most recent max_size samples are moved to the start,
+        so that the history is always a contiguous, time-ordered view for NumPy to search.
+
+        Args:
+            max_size (int): The number of samples to retain.
+            decimate (int, optional): If greater than 1, each run of this many consecutive
+                                      samples is averaged into a single sample (at their mean
+                                      time), as an anti-aliasing filter for high-rate inputs.
+        """
+        self.max_size = max_size
+        self.decimate = decimate
+        self.times = np.empty(2 * max_size, dtype=np.float64)
+        self.values = np.empty(2 * max_size, dtype=np.float64)
+        self.start = 0
+        self.end = 0
+
+        self.decimate_count = 0
+        self.decimate_time_sum = 0.0
+        self.decimate_value_sum = 0.0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def add(self, sample_time: float, value: float):
+        if self.decimate > 1:
+            self.decimate_count += 1
+            self.decimate_time_sum += sample_time
+            self.decimate_value_sum += value
+            if self.decimate_count < self.decimate:
+                return
+            sample_time = self.decimate_time_sum / self.decimate_count
+            value = self.decimate_value_sum / self.decimate_count
+            self.decimate_count = 0
+            self.decimate_time_sum = 0.0
+            self.decimate_value_sum = 0.0
+
+        #--------------------------------------------------------------
+        # Samples that arrive out of order (e.g. from a source with a
+        # skewed clock) are dropped, to keep the history sorted.
+        #--------------------------------------------------------------
+        if self.end > self.start and sample_time < self.times[self.end - 1]:
+            return
+
+        if self.end == len(self.times):
+            size = self.end - self.start
+            keep = min(size, self.max_size - 1)
+            self.times[:keep] = self.times[self.end - keep:self.end]
+            self.values[:keep] = self.values[self.end - keep:self.end]
+            self.start = 0
+            self.end = keep
+
+        self.times[self.end] = sample_time
+        self.values[self.end] = value
+        self.end += 1
+        if self.end - self.start > self.max_size:
+            self.start += 1
+
+    def hold(self, sample_time: float) -> Optional[float]:
+        """
+        Returns:
+            float: The value of the latest sample at or before sample_time. If there is none,
+                   the earliest sample's value is returned, or None if the history is empty.
+        """
+        if self.end == self.start:
+            return None
+        times = self.times[self.start:self.end]
+        index = np.searchsorted(times, sample_time, side="right") - 1
+        return float(self.values[self.start + max(index, 0)])
+
+    def linear(self, sample_time: float) -> Optional[float]:
+        """
+        Returns:
+            float: The value at sample_time, interpolated linearly between the samples either
+                   side of it, or held beyond the first or last sample.
+        """
+        if self.end == self.start:
+            return None
+        return float(np.interp(sample_time,
+                               self.times[self.start:self.end],
+                               self.values[self.start:self.end]))
+
+    def mean(self, sample_time: float, window: float) -> Optional[float]:
+        """
+        Returns:
+            float: The mean of the samples in the window of the given duration ending at
+                   sample_time, or the held value if the window contains no samples.
+        """
+        if self.end == self.start:
+            return None
+        times = self.times[self.start:self.end]
+        window_start = np.searchsorted(times, sample_time - window, side="right")
+        window_end = np.searchsorted(times, sample_time, side="right")
+        if window_end <= window_start:
+            return self.hold(sample_time)
+        return float(self.values[self.start + window_start:self.start + window_end].mean())
+
+class Resampler:
+    def __init__(self,
+                 mode: str = "hold",
+                 window: Optional[float] = None,
+                 delay: float = 0.0,
+                 history_size: int = 256):
+        """
+        Resamples properties that arrive at different rates onto a shared clock.
+
+        Each sample of a registered property is recorded in a short timestamped history, as it
+        arrives. On each tick, resample() returns every property's value at the tick's time,
+        so that frames are properly aligned across sources, regardless of how many samples
+        arrived from each since the last tick.
+
+        Modes:
+         - hold: the value of the latest sample (sample-and-hold)
+         - linear: linear interpolation between the samples either side
+         - mean: the mean of the samples within the preceding window
+
+        Samples may be added from source threads while the main loop resamples.
+
+        Usage:
+            resampler = Resampler(mode="linear", delay=0.1)
+            resampler.add_property("imu_x", decimate=4)
+            resampler.add_samples({"imu_x": 0.5}, time.time())
+            values = resampler.resample(time.time())
+
+        Args:
+            mode (str, optional): The default interpolation mode. Defaults to "hold".
+            window (float, optional): The default window for "mean" mode, in seconds.
+            delay (float, optional): The time by which output lags the clock, in seconds. Linear
+                                     interpolation requires a sample after the output time, so a
+                                     delay of at least the slowest source's sample interval avoids
+                                     holding at the latest sample. Defaults to 0.0.
+            history_size (int, optional): The number of samples retained per property. Defaults to 256.
+        """
+        if mode not in MODES:
+            raise ValueError("Resampling mode not known: %s (must be one of %s)" % (mode, ", ".join(MODES)))
+        self.mode = mode
+        self.window = window
+        self.delay = delay
+        self.history_size = history_size
+        self.histories = {}
+        self.modes = {}
+        self.windows = {}
+        self.lock = threading.Lock()
+
+    def add_property(self,
+                     name: str,
+                     mode: Optional[str] = None,
+                     window: Optional[float] = None,
+                     decimate: int = 1):
+        """
+        Register a property to resample, replacing any existing settings for the property.
+
+        Args:
+            name (str): The property name.
+            mode (str, optional): The interpolation mode, overriding the default.
+            window (float, optional): The window for "mean" mode, overriding the default.
+            decimate (int, optional): If greater than 1, each run of this many consecutive
+                                      samples is averaged into one before interpolation.
+        """
+        mode = mode or self.mode
+        if mode not in MODES:
+            raise ValueError("Resampling mode not known: %s (must be one of %s)" % (mode, ", ".join(MODES)))
+        if mode == "mean" and (window or self.window) is None:
+            raise ValueError("Resampling mode mean requires a window")
+        with self.lock:
+            self.histories[name] = SampleHistory(self.history_size, decimate=decimate)
+            self.modes[name] = mode
+            self.windows[name] = window or self.window
+
+    @property
+    def property_names(self) -> list[str]:
+        return list(self.histories.keys())
+
+    def add_samples(self, values: dict, sample_time: float):
+        """
+        Record new samples. Values of unregistered properties, and non-numeric values, are ignored.
+
+        Args:
+            values (dict): The new values, keyed by property name.
+            sample_time (float): The time of the samples, as a UNIX timestamp.
+        """
+        histories = self.histories
+        with self.lock:
+            for name, value in list(values.items()):
+                history = histories.get(name)
+                if history is None or value is None:
+                    continue
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if value == value:
+                    history.add(sample_time, value)
+
+    def resample(self, clock_time: float) -> dict:
+        """
+        Get the value of each property at the given time, less the resampler's delay.
+
+        Args:
+            clock_time (float): The time of the tick, as a UNIX timestamp.
+
+        Returns:
+            dict: The resampled values, keyed by property name. Properties with no samples yet
+                  are omitted.
+        """
+        sample_time = clock_time - self.delay
+        values = {}
+        with self.lock:
+            for name, history in self.histories.items():
+                mode = self.modes[name]
+                if mode == "linear":
+                    value = history.linear(sample_time)
+                elif mode == "mean":
+                    value = history.mean(sample_time, self.windows[name])
+                else:
+                    value = history.hold(sample_time)
+                if value is not None:
+                    values[name] = value
+        return values
@@ -1,5 +1,22 @@
+import numpy as np
+
 from .base import Processor
 
+#--------------------------------------------------------------
+# scipy is slow to import, so lfilter is imported on first use.
+# False indicates that scipy is not available.
+#--------------------------------------------------------------
+lfilter = None
+
+def get_lfilter():
+    global lfilter
+    if lfilter is None:
+        try:
+            from scipy.signal import lfilter
+        except ModuleNotFoundError:
+            lfilter = False
+    return lfilter
+
 class ProcessorSmooth (Processor):
     def __init__(self, smoothing=None, max_rise_rate=None, max_fall_rate=None, max_rate_change=None):
         self.value = None
@@ -10,4 +27,38 @@ class ProcessorSmooth (Processor):
             self.value = value
         else:
             self.value = (self.smoothing * self.value) + ((1 - self.smoothing) * value)
-        return self.value
\ No newline at end of file
+        return self.value
+
+    def process_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Smooth an array of values, as a one-pole IIR filter. Uses scipy's lfilter if available.
+        Missing values (NaN) are skipped, as in streaming, and are returned as NaN.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        output = np.full(len(values), np.nan)
+        present = ~np.isnan(values)
+        samples = values[present]
+        if len(samples) == 0:
+            return output
+
+        smoothed = np.empty_like(samples)
+        offset = 0
+        if self.value is None:
+            smoothed[0] = self.value = samples[0]
+            offset = 1
+
+        if offset == len(samples):
+            pass
+        elif get_lfilter():
+            smoothed[offset:], _ = lfilter([1 - self.smoothing], [1, -self.smoothing], samples[offset:],
+                                           zi=[self.smoothing * self.value])
+        else:
+            smoothing = self.smoothing
+            value = self.value
+            for index in range(offset, len(samples)):
+                value = (smoothing * value) + ((1 - smoothing) * samples[index])
+                smoothed[index] = value
+
+        self.value = float(smoothed[-1])
+        output[present] = smoothed
+        return output
@@ -0,0 +1,277 @@
+import sys
+import inspect
+import logging
+import importlib
+import importlib.metadata
+from collections.abc import Mapping
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class LazyClassMap (Mapping):
+    def __init__(self, paths: dict[str, str]):
+        """
+        A mapping of type names to classes, which imports each class's module only when the
+        class is first looked up. This means that the optional dependencies of a source or
+        destination (e.g. pandas, zmq, mido) are only imported if it is used.
+
+        Args:
+            paths (dict[str, str]): A dict mapping each type name to the path of its class,
+                                    in the form "module:ClassName".
+        """
+        self.paths = dict(paths)
+        self.classes = {}
+
+    def __getitem__(self, name: str) -> type:
+        try:
+            return self.classes[name]
+        except KeyError:
+            module_name, class_name = self.paths[name].split(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+            self.classes[name] = cls
+            return cls
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, name) -> bool:
+        return name in self.paths
+
+    def get_type_name(self, instance: object) -> Optional[str]:
+        """
+        Find the type name of an instance, without importing any further modules: if the
+        instance's class is in the map, its module must already have been imported.
+
+        Returns:
+            str: The type name, or None if the instance's class is not in the map.
+        """
+        for name, path in self.paths.items():
+            module_name, class_name = path.split(":")
+            module = sys.modules.get(module_name)
+            if module is not None and isinstance(instance, getattr(module, class_name)):
+                return name
+        return None
+
+class ComponentRegistry (LazyClassMap):
+    def __init__(self,
+                 group: str,
+                 paths: dict[str, str],
+                 config_paths: Optional[dict[str, str]] = None):
+        """
+        A registry of source, destination or processor classes, keyed by the type name used in
+        config files. Classes are resolved on first lookup from three places, in order:
+
+         - classes registered with the register() decorator
+         - built-in classes, given as "module:ClassName" paths
+         - entry points in the given group, declared by installed packages, e.g. in pyproject.toml:
+
+               [project.entry-points."dataplex.sources"]
+               imu = "my_package.imu:SourceIMU"
+
+        Each type may be bound to a pydantic config model, used to validate its section of the
+        config file. Plugins can declare their model with a config_class class attribute.
+
+        Args:
+            group (str): The entry point group to search for plugins.
+            paths (dict[str, str]): The built-in classes, mapping each type name to "module:ClassName".
+            config_paths (dict[str, str], optional): The config models of built-in classes, mapping each
+                                                     type name to "module:ClassName".
+        """
+        super().__init__(paths)
+        self.group = group
+        self.config_paths = dict(config_paths or {})
+        self.config_classes = {}
+        self.entry_points = None
+
+    def get_entry_points(self) -> dict:
+        """
+        Returns:
+            dict: The entry points in this registry's group, keyed by name. Listing entry points
+                  reads package metadata only, and does not import any plugin modules.
+        """
+        if self.entry_points is None:
+            entry_points = importlib.metadata.entry_points()
+            if hasattr(entry_points, "select"):
+                entry_points = entry_points.select(group=self.group)
+            else:
+                entry_points = entry_points.get(self.group, [])
+            self.entry_points = dict((entry_point.name, entry_point) for entry_point in entry_points)
+        return self.entry_points
+
+    def register(self, name: str, config_class: Optional[type] = None):
+        """
+        Decorator to register a class under the given type name.
+
+        Usage:
+            @register_source("imu", config_class=IMUSourceConfig)
+            class SourceIMU (Source):
+                ...
+
+        Args:
+            name (str): The type name, as used in config files.
+            config_class (type, optional): The pydantic model for this type's config.
+        """
+        def decorator(cls: type) -> type:
+            self.classes[name] = cls
+            if config_class is not None:
+                self.config_classes[name] = config_class
+            return cls
+        return decorator
+
+    def __getitem__(self, name: str) -> type:
+        if name in self.classes or name in self.paths:
+            return super().__getitem__(name)
+        entry_point = self.get_entry_points()[name]
+        logger.debug("Loading plugin %s from %s" % (name, entry_point.value))
+        cls = entry_point.load()
+        self.classes[name] = cls
+        return cls
+
+    def __iter__(self):
+        names = list(self.paths)
+        names += [name for name in self.classes if name not in self.paths]
+        names += [name for name in self.get_entry_points() if name not in names]
+        return iter(names)
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def __contains__(self, name) -> bool:
+        return name in self.classes or name in self.paths or name in self.get_entry_points()
+
+    def get_type_name(self, instance: object) -> Optional[str]:
+        for name, cls in self.classes.items():
+            if isinstance(instance, cls):
+                return name
+        return super().get_type_name(instance)
+
+    def get_config_class(self, name: str, default: type) -> type:
+        """
+        Get the config model bound to the given type name.
+
+        Args:
+            name (str): The type name.
+            default (type): The model to use if none is bound.
+
+        Returns:
+            type: The pydantic model class.
+        """
+        if name in self.config_classes:
+            return self.config_classes[name]
+        if name in self.config_paths:
+            module_name, class_name = self.config_paths[name].split(":")
+            config_class = getattr(importlib.import_module(module_name), class_name)
+        else:
+            config_class = getattr(self[name], "config_class", None) or default
+        self.config_classes[name] = config_class
+        return config_class
+
+def create_from_config(cls: type, config, exclude: list[str], **kwargs):
+    """
+    Instantiate a class from a config model, passing each config field (plus any additional
+    keyword arguments) as a keyword argument, if the class's constructor accepts it.
+
+    Args:
+        cls (type): The class to instantiate.
+        config (BaseModel): The config model.
+        exclude (list[str]): Config fields that are handled by the caller, and are not passed.
+        kwargs: Additional keyword arguments, which take precedence over config fields.
+
+    Returns:
+        The new instance.
+    """
+    values = dict((name, value) for name, value in config.model_dump().items() if name not in exclude)
+    values.update(kwargs)
+
+    parameters = inspect.signature(cls.__init__).parameters
+    if any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()):
+        return cls(**values)
+
+    unused = [name for name in values if name not in parameters]
+    if unused:
+        logger.debug("%s: Ignoring config fields not accepted by constructor: %s" % (cls.__name__, ", ".join(unused)))
+    return cls(**dict((name, value) for name, value in values.items() if name in parameters))
+
+#--------------------------------------------------------------------------------
+# Registries of built-in and plugin components.
+#--------------------------------------------------------------------------------
+sources = ComponentRegistry("dataplex.sources", {
+    "pakbus": "dataplex.sources.pakbus:SourcePakbus",
+    "ultimeter": "dataplex.sources.ultimeter:SourceUltimeter",
+    "csv": "dataplex.sources.csv:SourceCSV",
+    "npy": "dataplex.sources.npy:SourceNPY",
+    "osc": "dataplex.sources.osc:SourceOSC",
+    "jdp": "dataplex.sources.jdp:SourceJDP",
+    "video": "dataplex.sources.webcam:SourceWebcam",
+    "audio": "dataplex.sources.audio:SourceAudio",
+    "serial": "dataplex.sources.serial:SourceSerial",
+    "zmq": "dataplex.sources.zmq:SourceZMQ"
+}, config_paths={
+    "pakbus": "dataplex.config:PakbusSourceConfig",
+    "ultimeter": "dataplex.config:UltimeterSourceConfig",
+    "csv": "dataplex.config:CSVSourceConfig",
+    "npy": "dataplex.config:NPYSourceConfig",
+    "osc": "dataplex.config:OSCSourceConfig",
+    "jdp": "dataplex.config:JDPSourceConfig",
+    "video": "dataplex.config:VideoSourceConfig",
+    "audio": "dataplex.config:AudioSourceConfig",
+    "serial": "dataplex.config:SerialSourceConfig",
+    "zmq": "dataplex.config:ZMQSourceConfig"
+})
+
+destinations = ComponentRegistry("dataplex.destinations", {
+    "csv": "dataplex.destinations.csv:DestinationCSV",
+    "npy": "dataplex.destinations.npy:DestinationNPY",
+    "osc": "dataplex.destinations.osc:DestinationOSC",
+    "jdp": "dataplex.destinations.jdp:DestinationJDP",
+    "stdout": "dataplex.destinations.stdout:DestinationStdout",
+    "midi": "dataplex.destinations.midi:DestinationMidi",
+    "scope": "dataplex.destinations.scope:DestinationScope",
+    "zmq": "dataplex.destinations.zmq:DestinationZMQ",
+    "shm": "dataplex.destinations.shm:DestinationSharedMemory"
+}, config_paths={
+    "csv": "dataplex.config:CSVDestinationConfig",
+    "npy": "dataplex.config:NPYDestinationConfig",
+    "osc": "dataplex.config:OSCDestinationConfig",
+    "jdp": "dataplex.config:JDPDestinationConfig",
+    "stdout": "dataplex.config:StdoutDestinationConfig",
+    "scope": "dataplex.config:ScopeDestinationConfig",
+    "zmq": "dataplex.config:ZMQDestinationConfig",
+    "shm": "dataplex.config:SharedMemoryDestinationConfig"
+})
+
+processors = ComponentRegistry("dataplex.processors", {
+    "smooth": "dataplex.processors.smooth:ProcessorSmooth",
+    "linear": "dataplex.processors.normalise.linear:ProcessorLinearNormalise",
+    "ecdf": "dataplex.processors.normalise.ecdf:ProcessorECDFNormalise"
+})
+
+register_source = sources.register
+register_destination = destinations.register
+register_processor = processors.register
+
+def lazy_module_getattr(module_name: str, paths: dict[str, str]):
+    """
+    Create a module-level __getattr__ (PEP 562), which imports each attribute from its
+    submodule on first access.
+
+    Args:
+        module_name (str): The name of the package, used to resolve relative submodules.
+        paths (dict[str, str]): A dict mapping each attribute name to its submodule, relative
+                                to the package (e.g. {"SourceCSV": ".csv"}).
+
+    Returns:
+        Callable: The __getattr__ function.
+    """
+    def __getattr__(name: str):
+        try:
+            submodule_name = paths[name]
+        except KeyError:
+            raise AttributeError("module %s has no attribute %s" % (module_name, name))
+        value = getattr(importlib.import_module(submodule_name, module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+    return __getattr__
@@ -1,10 +1,20 @@
-from .source import Source
-from .csv import SourceCSV
-from .audio import SourceAudio
-from .pakbus import SourcePakbus
-from .webcam import SourceWebcam
-from .ultimeter import SourceUltimeter
-from .jdp import SourceJDP
-from .serial import SourceSerial
-from .osc import SourceOSC
-from .zmq import SourceZMQ
\ No newline at end of file
+from .source import Source, EndOfStream
+from ..registry import lazy_module_getattr
+
+#--------------------------------------------------------------------------------
+# Sources are imported on first access, so that each source's dependencies
+# (e.g. pandas, signalflow, cv2, zmq) are only imported if it is used.
+#--------------------------------------------------------------------------------
+__getattr__ = lazy_module_getattr(__name__, {
+    "SourceCSV": ".csv",
+    "SourceNPY": ".npy",
+    "read_npy_log": ".npy",
+    "SourceAudio": ".audio",
+    "SourcePakbus": ".pakbus",
+    "SourceWebcam": ".webcam",
+    "SourceUltimeter": ".ultimeter",
+    "SourceJDP": ".jdp",
+    "SourceSerial": ".serial",
+    "SourceOSC": ".osc",
+    "SourceZMQ": ".zmq"
+})
@@ -17,6 +17,10 @@ class SourceAudio (Source):
         self.feature_nodes = {}
         self.input_node = None
 
+    @classmethod
+    def from_config(cls, config, property_names: list[str]):
+        return cls(properties=property_names)
+
     def set_input_node(self, node: Node):
         assert isinstance(node, Node), "Input node must be a SignalFlow Node"
         self.input_node = node
@@ -1,8 +1,10 @@
 import os
 import time
 import argparse
+import numpy as np
 import pandas as pd
 import datetime
+from typing import Optional, Union
 
 from .source import Source
 from ..settings import timestamp_field_name
@@ -11,78 +13,218 @@ class SourceCSV (Source):
     def __init__(self,
                  path: str,
                  rate: float = 1.0,
-                 property_names: list[str] = None):
+                 property_names: list[str] = None,
+                 realtime: bool = True,
+                 chunk_size: int = 10000,
+                 start_at: Optional[Union[str, datetime.datetime]] = None):
         """
-        Read a CSV file.
+        Read a CSV file. The file is read incrementally, so that memory usage is constant
+        regardless of file size. Compressed files (e.g. .csv.gz) are decompressed on the fly.
 
         Args:
             filename (str): The file path to read.
             rate (float, optional): The rate that data should be output, relative to the original
                                     time series. Defaults to 1.0.
+            realtime (bool, optional): If False, replays the file as fast as possible, returning the
+                                       next record on every collect(). Dataplex then runs on a virtual
+                                       clock taken from the CSV time column, without sleeping between
+                                       reads. Defaults to True.
+            chunk_size (int, optional): The number of rows to read from the file at a time.
+                                        Defaults to 10000.
+            start_at (str or datetime, optional): If specified, begin playback from the first record
+                                                  at or after this time.
         """
         super().__init__()
 
         self.filename = path
         self.rate = rate
+        self.is_realtime = realtime
+        self.chunk_size = chunk_size
 
-        df = pd.read_csv(path, parse_dates=[timestamp_field_name])
-        self.records = iter(df.to_dict(orient="records"))
+        #------------------------------------------------------------------------
+        # Read the header only, to validate property names.
+        #------------------------------------------------------------------------
+        self.columns = self.read_columns()
         self.data = None
 
         if property_names:
             for property_name in property_names:
-                if property_name not in df.columns:
+                if property_name not in self.columns:
                     raise ValueError("Specified property name not found in CSV: %s" % property_name)
             self.property_names = property_names
         else:
-            self.property_names = list(df.columns)
+            self.property_names = self.columns
+
+        #------------------------------------------------------------------------
+        # The current chunk of rows. Timestamps are held as a sorted array of
+        # int64 nanoseconds, so that the latest due row can be found by binary
+        # search. position is the index of the most recently returned row.
+        #------------------------------------------------------------------------
+        self.chunks = self.iter_chunks()
+        self.chunk_times = np.zeros(0, dtype=np.int64)
+        self.chunk_values = {}
+        self.position = -1
+        self.is_finished = False
 
         self.t0_log = None
         self.t0_time = None
 
-        self.read()
+        if not self.read_chunk():
+            raise ValueError("CSV file contains no records: %s" % path)
+        if start_at is not None:
+            self.seek(start_at)
 
     def __str__(self):
         return ("CSV (%s)" % os.path.basename(self.filename))
 
-    def read(self):
-        self.next_row = next(self.records)
-        return self.next_row
+    def read_columns(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The column names of the file.
+        """
+        return list(pd.read_csv(self.filename, nrows=0).columns)
+
+    def iter_chunks(self):
+        """
+        Generate chunks of the file, chunk_size rows at a time, so only the current chunk is
+        held in memory.
+
+        Yields:
+            tuple: (times, values), where times is an int64 array of nanosecond timestamps,
+                   and values is a dict of per-column lists of values.
+        """
+        reader = pd.read_csv(self.filename,
+                             parse_dates=[timestamp_field_name],
+                             chunksize=self.chunk_size)
+        with reader:
+            for chunk in reader:
+                times = chunk[timestamp_field_name].to_numpy(dtype="datetime64[ns]").view(np.int64)
+                values = dict((column, chunk[column].tolist()) for column in chunk.columns)
+                yield times, values
+
+    def read_chunk(self) -> bool:
+        """
+        Read the next chunk of rows.
+
+        Returns:
+            bool: False if there are no more rows.
+        """
+        for times, values in self.chunks:
+            if len(times):
+                self.chunk_times = times
+                self.chunk_values = values
+                self.position = -1
+                return True
+        return False
+
+    def get_row(self, index: int) -> dict:
+        return dict((column, values[index]) for column, values in self.chunk_values.items())
+
+    def seek(self, start_at: Union[str, datetime.datetime]):
+        """
+        Skip forward to the first record at or after the given time. Chunks that end before
+        this time are skipped without being processed.
+
+        Args:
+            start_at (str or datetime): The time to seek to.
+
+        Raises:
+            ValueError: If there are no records at or after this time.
+        """
+        target = pd.Timestamp(start_at).to_datetime64().astype("datetime64[ns]").view(np.int64)
+        while self.chunk_times[-1] < target:
+            if not self.read_chunk():
+                raise ValueError("No records found after start time: %s" % start_at)
+
+        #------------------------------------------------------------------------
+        # Position immediately before the first due row, so that it is the
+        # next to be returned.
+        #------------------------------------------------------------------------
+        self.position = int(np.searchsorted(self.chunk_times, target, side="left")) - 1
+        self.t0_log = None
+
+    def advance(self) -> bool:
+        """
+        Advance to the next row, reading a new chunk if needed.
+
+        Returns:
+            bool: False if there are no more rows.
+        """
+        if self.position + 1 < len(self.chunk_times):
+            self.position += 1
+            return True
+        elif self.read_chunk():
+            self.position = 0
+            return True
+        else:
+            return False
+
+    def peek_next_time(self) -> Optional[int]:
+        """
+        Returns:
+            int: The timestamp of the row following the current row, in nanoseconds,
+                 or None if the current row is the last in the file.
+        """
+        if self.position + 1 >= len(self.chunk_times):
+            if not self.read_chunk():
+                return None
+        return int(self.chunk_times[self.position + 1])
 
     def collect(self, blocking: bool = False):
         """
         Block until the next reading is due, based on our CSV read rate.
+        In fast replay mode, return the next record immediately.
         """
+        if self.is_finished:
+            raise StopIteration
+
+        if not self.is_realtime:
+            if not self.advance():
+                self.is_finished = True
+                raise StopIteration
+            self.data = self.get_row(self.position)
+            return self.data
 
         if self.t0_log is None:
             #------------------------------------------------------------------------
             # If no rows have been read, process the first row to set our initial
             # time.
             #------------------------------------------------------------------------
-            self.data = next(self.records)
-            self.t0_log = self.data[timestamp_field_name]
+            self.advance()
+            self.data = self.get_row(self.position)
+            self.t0_log = int(self.chunk_times[self.position])
             self.t0_time = datetime.datetime.now()
-            self.next_row = next(self.records)
 
-        log_delta = (self.next_row[timestamp_field_name] - self.t0_log).total_seconds() / float(self.rate)
         time_delta = (datetime.datetime.now() - self.t0_time).total_seconds()
+        log_time = self.t0_log + int(time_delta * self.rate * 1e9)
 
         if blocking:
-            while time_delta <= log_delta:
+            next_time = self.peek_next_time()
+            while next_time is not None and log_time < next_time:
                 #------------------------------------------------------------------------
                 # wait until we've hit the required time
                 #------------------------------------------------------------------------
                 time.sleep(0.01)
                 time_delta = (datetime.datetime.now() - self.t0_time).total_seconds()
+                log_time = self.t0_log + int(time_delta * self.rate * 1e9)
+
+        #------------------------------------------------------------------------
+        # If one or more rows are due, skip straight to the latest due row by
+        # binary search, rather than stepping through each row.
+        #------------------------------------------------------------------------
+        while True:
+            next_time = self.peek_next_time()
+            if next_time is None:
+                #------------------------------------------------------------------------
+                # Reached the end of the file: end the stream on the next collect.
+                #------------------------------------------------------------------------
+                self.is_finished = True
+                break
+            if next_time > log_time:
+                break
 
-        while time_delta >= log_delta:
-            #------------------------------------------------------------------------
-            # TODO
-            # skip over multiple readings
-            #------------------------------------------------------------------------
-            self.data = self.next_row
-            self.next_row = next(self.records)
-            log_delta = (self.next_row[timestamp_field_name] - self.t0_log).total_seconds() / float(self.rate)
+            self.position = int(np.searchsorted(self.chunk_times, log_time, side="right")) - 1
+            self.data = self.get_row(self.position)
 
         return self.data
 
@@ -90,10 +232,12 @@ class SourceCSV (Source):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--rate", type=float, default=1.0, help="Rate to output records relative to original CSV timestamps")
-    parser.add_argument("input_path", help="CSV file to read")
+    parser.add_argument("--fast", action="store_true", help="Replay records as fast as possible")
+    parser.add_argument("--start-at", type=str, default=None, help="Begin playback from this time")
+    parser.add_argument("input_path", help="CSV file to read (optionally gzipped)")
     args = parser.parse_args()
 
-    source = SourceCSV(args.input_path, rate=args.rate)
+    source = SourceCSV(args.input_path, rate=args.rate, realtime=not args.fast, start_at=args.start_at)
 
     while True:
         print(source.collect())
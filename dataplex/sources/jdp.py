@@ -4,6 +4,8 @@ import argparse
 from .source import Source
 
 class SourceJDP (Source):
+    is_push = True
+
     def __init__(self,
                  property_names: list[str],
                  port: int = 48000):
@@ -25,13 +27,15 @@ class SourceJDP (Source):
         return ("JDP (%s)" % self.server)
 
     def handle_data(self, data: dict):
+        values = {}
         for key, value in data.items():
             if key in self.property_names:
                 # TODO: When receiving the output of ECDFNormaliser
                 if isinstance(value, dict):
-                    self.data[key] = value["value"]
+                    values[key] = value["value"]
                 else:
-                    self.data[key] = value
+                    values[key] = value
+        self.publish(values)
 
     def collect(self, blocking: bool = False):
         """
@@ -0,0 +1,87 @@
+import os
+import glob
+import json
+import argparse
+import numpy as np
+import pandas as pd
+
+from .csv import SourceCSV
+from ..destinations.npy import NPY_FORMAT_NAME, get_chunk_paths
+from ..settings import timestamp_field_name
+
+def read_npy_log(path: str) -> dict:
+    """
+    Read a complete columnar log written by DestinationNPY, for offline analysis
+    (e.g. with Dataplex.process_batch()).
+
+    Args:
+        path (str): The log directory.
+
+    Returns:
+        dict: A dict of NumPy arrays, keyed by property name, plus a datetime64 time array.
+    """
+    with open(os.path.join(path, "schema.json")) as fd:
+        schema = json.load(fd)
+    row_group_count = len(glob.glob(os.path.join(path, "*.time.npy")))
+    chunk_paths = [get_chunk_paths(path, index) for index in range(row_group_count)]
+    times = np.concatenate([np.load(time_path, mmap_mode="r") for time_path, _ in chunk_paths])
+    values = np.concatenate([np.load(values_path, mmap_mode="r") for _, values_path in chunk_paths], axis=1)
+
+    log = {timestamp_field_name: times.view("datetime64[ns]")}
+    for property_index, property_name in enumerate(schema["property_names"]):
+        log[property_name] = values[property_index]
+    return log
+
+class SourceNPY (SourceCSV):
+    """
+    Replay a columnar binary log written by DestinationNPY. Each row group is memory-mapped
+    rather than parsed, and playback options are the same as for SourceCSV.
+    """
+
+    def __str__(self):
+        return ("NPY (%s)" % os.path.basename(os.path.normpath(self.filename)))
+
+    def read_columns(self) -> list[str]:
+        schema_path = os.path.join(self.filename, "schema.json")
+        if not os.path.exists(schema_path):
+            raise FileNotFoundError("NPY log schema not found: %s" % schema_path)
+        with open(schema_path) as fd:
+            self.schema = json.load(fd)
+        if self.schema.get("format") != NPY_FORMAT_NAME:
+            raise ValueError("Not a dataplex NPY log: %s" % self.filename)
+
+        return [timestamp_field_name] + self.schema["property_names"]
+
+    def iter_chunks(self):
+        """
+        Generate each row group of the log, memory-mapped from disk.
+
+        Yields:
+            tuple: (times, values), where times is an int64 array of nanosecond timestamps,
+                   and values is a dict of per-column arrays.
+        """
+        property_names = self.schema["property_names"]
+        row_group_count = len(glob.glob(os.path.join(self.filename, "*.time.npy")))
+        for index in range(row_group_count):
+            time_path, values_path = get_chunk_paths(self.filename, index)
+            times = np.load(time_path, mmap_mode="r")
+            values = np.load(values_path, mmap_mode="r")
+
+            columns = {timestamp_field_name: pd.to_datetime(times)}
+            for property_index, property_name in enumerate(property_names):
+                columns[property_name] = values[property_index]
+            yield np.asarray(times), columns
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=1.0, help="Rate to output records relative to original timestamps")
+    parser.add_argument("--fast", action="store_true", help="Replay records as fast as possible")
+    parser.add_argument("--start-at", type=str, default=None, help="Begin playback from this time")
+    parser.add_argument("input_path", help="NPY log directory to read")
+    args = parser.parse_args()
+
+    source = SourceNPY(args.input_path, rate=args.rate, realtime=not args.fast, start_at=args.start_at)
+
+    while True:
+        print(source.collect())
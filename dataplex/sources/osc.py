@@ -10,9 +10,12 @@ logger = logging.getLogger("dataplex")
 from .source import Source
 
 class SourceOSC (Source):
+    is_push = True
+
     def __init__(self,
                  port: int = 8000,
-                 properties: dict = None):
+                 properties: dict = None,
+                 property_names: list[str] = None):
         """
         Listen for OSC datagrams.
 
@@ -22,11 +25,13 @@ class SourceOSC (Source):
          - 
 
         Args:
-            property_names (list[str]): The list of expected fields
             port (int): The port to listen on.
+            properties (dict, optional): The expected fields, mapped to their types ("float" or "vec3").
+                                         A vec3 field named foo is expanded to foo_x, foo_y and foo_z.
+            property_names (list[str], optional): Further expected fields, e.g. from a config file.
         """
         super().__init__()
-        self.property_names = []
+        self.property_names = list(property_names or [])
         if properties:
             for property_name, property_type in properties.items():
                 if property_type == "vec3":
@@ -53,16 +58,18 @@ class SourceOSC (Source):
 
         if len(args) == 1:
             value = args[0]
-            self.data[property_name] = value
+            self.publish({property_name: value})
         elif len(args) > 1 and len(args) < 4:
             arg_suffixes = ["x", "y", "z"]
+            values = {}
             for i, value in enumerate(args):
                 property_subname = "%s_%s" % (property_name, arg_suffixes[i])
-                self.data[property_subname] = value
+                values[property_subname] = value
+            self.publish(values)
         elif len(args) > 3:
             print("Too many arguments for field %s" % property_name)
         else:
-            self.data[property_name] = None
+            self.publish({property_name: None})
 
     def start(self):
         thread = threading.Thread(target=self.run, daemon=True)
@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 
 
 class SourceSerial (Source):
+    is_push = True
+
     def __init__(self,
                  property_names: list[str],
                  port_name: str = None,
@@ -113,8 +115,7 @@ class SourceSerial (Source):
                         if len(values) != len(self.property_names):
                             raise RuntimeError("Unexpected number of fields read from serial connection (found %d, expected %d)" %
                                                (len(values), len(self.property_names)))
-                        for field, value in zip(self.property_names, values):
-                            self.data[field] = value
+                        self.publish(dict(zip(self.property_names, values)))
 
                     time.sleep(0.01)
 
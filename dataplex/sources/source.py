@@ -1,13 +1,124 @@
+import time
+import asyncio
+
+from ..registry import create_from_config
+
+class EndOfStream (Exception):
+    """
+    Raised by Source.collect_async() when a source stream terminates. This replaces
+    StopIteration, which cannot be propagated through a coroutine.
+    """
+    pass
+
 class Source:
+    #--------------------------------------------------------------------------------
+    # Push-style sources receive data asynchronously (e.g. on a network or serial
+    # thread) rather than when collect() is called. They set is_push = True and
+    # call publish() (or notify()) whenever new data arrives, so that the event-driven
+    # scheduler can wake immediately rather than waiting for the next read interval.
+    #--------------------------------------------------------------------------------
+    is_push = False
+    data_event = None
+
+    #--------------------------------------------------------------------------------
+    # Offline sources (e.g. fast replay of a logfile) set is_realtime = False.
+    # Their records carry their own timestamps, and the main loop then runs on
+    # this virtual clock without waiting between reads.
+    #--------------------------------------------------------------------------------
+    is_realtime = True
+
+    #--------------------------------------------------------------------------------
+    # Sources that receive data asynchronously record each sample's arrival time
+    # (as a UNIX timestamp) and a per-property sequence number, by calling publish().
+    # Sources that do not are assumed to return a new sample for each property on
+    # each call to collect().
+    #--------------------------------------------------------------------------------
+    sample_times = None
+    sequence_numbers = None
+    last_sample_time = None
+
+    #--------------------------------------------------------------------------------
+    # If set, properties whose latest sample is older than stale_after seconds are
+    # treated according to stale_policy ("hold", "null" or "interpolate"). Defaults
+    # are taken from the general config.
+    #--------------------------------------------------------------------------------
+    stale_after = None
+    stale_policy = None
+
+    #--------------------------------------------------------------------------------
+    # If resampling is enabled, the Resampler that published samples are recorded in,
+    # so that every sample is retained, not just the latest before each read.
+    #--------------------------------------------------------------------------------
+    resampler = None
+
     def __init__(self):
         self.property_names = []
 
+    @classmethod
+    def from_config(cls, config, property_names: list[str]):
+        """
+        Create a source from its config. By default, each config field is passed to the
+        constructor as a keyword argument, if the constructor accepts it. Subclasses whose
+        constructor arguments differ from their config fields should override this method.
+
+        Args:
+            config (SourceConfig): The source's config.
+            property_names (list[str]): The names of the properties to read.
+
+        Returns:
+            Source: The new source.
+        """
+        return create_from_config(cls, config,
+                                  exclude=["name", "type", "enabled", "properties", "stale_after", "stale_policy"],
+                                  property_names=property_names)
+
     def start(self):
         """
         Start the Source. This may be overridden by subclasses to run any initialisation
         code whose properties may have been set during setup.
         """
         pass
+
+    def set_data_event(self, event):
+        """
+        Set the event that is triggered when new data arrives.
+
+        Args:
+            event (threading.Event): The event to set on new data.
+        """
+        self.data_event = event
+
+    def publish(self, values: dict):
+        """
+        Record newly-arrived values, with their arrival time and sequence numbers, and signal
+        that new data has arrived. Called by push-style sources, which return self.data from
+        collect().
+
+        Args:
+            values (dict): The new values, keyed by property name.
+        """
+        if self.sample_times is None:
+            self.sample_times = {}
+            self.sequence_numbers = {}
+        if getattr(self, "data", None) is None:
+            self.data = {}
+
+        now = time.time()
+        for name, value in values.items():
+            self.data[name] = value
+            self.sample_times[name] = now
+            self.sequence_numbers[name] = self.sequence_numbers.get(name, 0) + 1
+        self.last_sample_time = now
+        if self.resampler is not None:
+            self.resampler.add_samples(values, now)
+        self.notify()
+
+    def notify(self):
+        """
+        Signal that new data has arrived. Called by push-style sources.
+        """
+        if self.data_event is not None:
+            self.data_event.set()
         
     def collect(self, blocking: bool = False):
         """
@@ -21,4 +132,30 @@ class Source:
             dict: The new data, or None if no new data is available.
         """
         if self.data:
-            return self.data
\ No newline at end of file
+            return self.data
+
+    async def collect_async(self):
+        """
+        Asynchronous equivalent of collect(), used by Dataplex.run_async().
+
+        Subclasses with a native asyncio implementation should override this method.
+        By default, push-style and offline sources are collected directly (as their collect()
+        returns immediately), and other sources are collected in a worker thread so that
+        blocking reads do not stall the event loop.
+
+        Returns:
+            dict: The new data, or None if no new data is available.
+
+        Raises:
+            EndOfStream: If the source stream has terminated.
+        """
+        if self.is_push or not self.is_realtime:
+            return self.collect_or_end()
+        else:
+            return await asyncio.to_thread(self.collect_or_end)
+
+    def collect_or_end(self):
+        try:
+            return self.collect()
+        except StopIteration:
+            raise EndOfStream("Source %s ended stream" % self)
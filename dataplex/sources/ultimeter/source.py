@@ -11,24 +11,33 @@ PROPERTIES = [
 ]
 
 class SourceUltimeter (Source):
+    is_push = True
+
     def __init__(self,
                  property_names: list[str] = PROPERTIES,
                  port: Optional[str] = None):
+        self.property_names = property_names
+        self.data = {}
         self.ultimeter = ultimeter.Ultimeter(port=port)
+
+        #--------------------------------------------------------------
+        # Ultimeter.handle() calls handler with its values after each
+        # complete message is parsed on the read thread.
+        #--------------------------------------------------------------
+        self.ultimeter.handler = self.handle_values
         self.ultimeter.start()
-        self.property_names = property_names
 
     def __str__(self):
         return ("Ultimeter")
 
-    def collect(self):
-        data = {}
-
-        for name in self.property_names:
-            if name in self.ultimeter.values:
-                data[name] = self.ultimeter.values[name]
+    def handle_values(self, values: dict):
+        """
+        Called by the Ultimeter read thread each time a record is received.
+        """
+        self.publish(dict((name, values[name]) for name in self.property_names if name in values))
 
-        return data
+    def collect(self):
+        return self.data
 
     def close(self):
         self.ultimeter.close()
@@ -1,17 +1,20 @@
+import queue
 import threading
 import argparse
 import logging
-import time
 from zeroconf import Zeroconf, ServiceBrowser
-import socket, zmq, time
+import socket, zmq
 
 SERVICE_TYPE = "_dataplex._tcp.local."
 
 logger = logging.getLogger("dataplex")
 
 from .source import Source
+from ..wire import FrameDecoder, is_encoding_available
 
 class SourceZMQ(Source):
+    is_push = True
+
     def __init__(self,
                  property_names: list[str] = None):
         """
@@ -23,15 +26,31 @@ class SourceZMQ(Source):
         super().__init__()
         self.property_names = property_names
         self.data = {}
-
+        self.data_lock = threading.Lock()
+
+        #--------------------------------------------------------------
+        # ZMQ sockets are not thread-safe, so all subscriber sockets are
+        # created, polled and closed by the receive thread. Zeroconf
+        # callbacks enqueue commands, and wake the receive thread via
+        # an inproc control socket.
+        #--------------------------------------------------------------
         self.sockets = {}
+        self.decoders = {}
         self.ctx = zmq.Context()
-        self.zc = Zeroconf()
-        self.browser = ServiceBrowser(self.zc, SERVICE_TYPE, self)
+        self.commands = queue.Queue()
+        control_endpoint = "inproc://dataplex-zmq-control-%d" % id(self)
+        self.control_receiver = self.ctx.socket(zmq.PULL)
+        self.control_receiver.bind(control_endpoint)
+        self.control_sender = self.ctx.socket(zmq.PUSH)
+        self.control_sender.connect(control_endpoint)
+        self.control_lock = threading.Lock()
 
+        self.new_data_event = threading.Event()
         self.thread = threading.Thread(target=self.run, daemon=True)
         self.thread.start()
-        self.new_data_event = threading.Event()
+
+        self.zc = Zeroconf()
+        self.browser = ServiceBrowser(self.zc, SERVICE_TYPE, self)
 
     def __str__(self):
         return ("SourceZMQ (%d sources)" % len(self.data))
@@ -44,8 +63,9 @@ class SourceZMQ(Source):
             self.new_data_event.wait()
             self.new_data_event.clear()
         
-        if self.data:
-            return self.data
+        with self.data_lock:
+            if self.data:
+                return dict(self.data)
 
     def add_service(self, zeroconf, type, name):
         # Zeroconf callback: new service discovered
@@ -55,40 +75,113 @@ class SourceZMQ(Source):
         ip = socket.inet_ntoa(info.addresses[0])
         port = info.port
         endpoint = f"tcp://{ip}:{port}"
-        logger.info(f"SourceZMQ: Discovered service: {name} at {endpoint}")
+        encoding = (info.properties or {}).get(b"encoding", b"json").decode()
+        logger.info(f"SourceZMQ: Discovered service: {name} at {endpoint} ({encoding})")
+        if not is_encoding_available(encoding):
+            logger.warning(f"SourceZMQ: Skipping service {name}, as encoding {encoding} is not available")
+            return
 
-        sock = self.ctx.socket(zmq.SUB)
-        sock.connect(endpoint)
-        sock.subscribe("")  # receive all topics
-        self.sockets[name] = sock
+        self.send_command(("add", name, endpoint))
 
     def remove_service(self, zeroconf, type, name):
         # Zeroconf callback: service removed
         logger.info(f"SourceZMQ: Service removed: {name}")
-        sock = self.sockets.pop(name, None)
-        if sock:
-            sock.close()
+        self.send_command(("remove", name))
 
     def update_service(self, zeroconf, type, name):
         pass
 
+    def send_command(self, command: tuple):
+        """
+        Enqueue a command for the receive thread, and wake it.
+        """
+        self.commands.put(command)
+        with self.control_lock:
+            self.control_sender.send(b"")
+
     def close(self):
         self.zc.close()
+        self.send_command(("stop",))
+        self.thread.join(timeout=1.0)
 
-    def run(self):
+    def run_commands(self, poller: zmq.Poller) -> bool:
+        """
+        Apply pending commands from the Zeroconf callbacks.
+
+        Returns:
+            bool: False if the receive thread should stop.
+        """
         while True:
+            try:
+                command = self.commands.get_nowait()
+            except queue.Empty:
+                return True
+
+            if command[0] == "add":
+                _, name, endpoint = command
+                sock = self.ctx.socket(zmq.SUB)
+                sock.connect(endpoint)
+                sock.subscribe("")  # receive all topics
+                self.sockets[name] = sock
+                self.decoders[name] = FrameDecoder()
+                poller.register(sock, zmq.POLLIN)
+            elif command[0] == "remove":
+                _, name = command
+                sock = self.sockets.pop(name, None)
+                self.decoders.pop(name, None)
+                if sock:
+                    poller.unregister(sock)
+                    sock.close()
+            elif command[0] == "stop":
+                return False
+
+    def run(self):
+        poller = zmq.Poller()
+        poller.register(self.control_receiver, zmq.POLLIN)
+        running = True
+
+        while running:
+            ready = dict(poller.poll())
+
+            if self.control_receiver in ready:
+                while self.control_receiver.poll(0):
+                    self.control_receiver.recv()
+                running = self.run_commands(poller)
+
+            #--------------------------------------------------------------
+            # Drain every queued message from each ready socket, keeping
+            # only the latest value per property, and publish once.
+            #--------------------------------------------------------------
+            updates = {}
             for name, sock in list(self.sockets.items()):
-                try:
-                    msg = sock.recv_json(flags=zmq.NOBLOCK)
-                    self.new_data_event.set()
-
-                    for key, value in msg.items():
-                        if (not self.property_names) or (key in self.property_names):
-                            self.data[key] = value
-                except zmq.Again:
-                    # No data to read
-                    pass
-            time.sleep(0.01)
+                if sock not in ready:
+                    continue
+                decoder = self.decoders[name]
+                while True:
+                    try:
+                        parts = sock.recv_multipart(flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    try:
+                        msg = decoder.decode(parts)
+                    except Exception as e:
+                        logger.warning(f"SourceZMQ: Failed to decode message from {name}: {e}")
+                        continue
+                    if msg is None:
+                        continue
+                    updates.update(msg)
+
+            if self.property_names:
+                updates = dict((key, value) for key, value in updates.items() if key in self.property_names)
+            if updates:
+                with self.data_lock:
+                    self.publish(updates)
+                self.new_data_event.set()
+
+        for sock in self.sockets.values():
+            sock.close()
+        self.sockets = {}
+        self.decoders = {}
 
 
 if __name__ == "__main__":
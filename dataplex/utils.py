@@ -8,7 +8,8 @@ def serialise_data(data: dict) -> dict:
         value: The value to serialise.
 
     Returns:
-        The JSON-encoded value. For ints, floats, and strings, this is the value itself.
+        The JSON-encoded value. For ints, floats, and strings, this is the value itself,
+        except that NaN (a missing value) is None, as NaN is not valid JSON.
         For datetime objects, this is a string in the format "YYYY-MM-DD HH:MM:SS.ssssss".
     """
     structure = {}
@@ -30,10 +31,106 @@ def serialise_data(data: dict) -> dict:
             #------------------------------------------------------------------------
             if isinstance(record, datetime.datetime):
                 structure[name] = record.strftime("%Y-%m-%d %H:%M:%S.%f")
+            elif isinstance(record, float) and record != record:
+                structure[name] = None
             else:
                 structure[name] = record
     return structure
 
+def serialise_record(record) -> dict:
+    return {
+        "value" : record.value,
+        "normalised" : record.normalised,
+        "previous_value" : record.previous_value,
+        "previous_normalised" : record.previous_normalised,
+        "change" : record.change
+    }
+
+def serialise_datetime(record: datetime.datetime) -> str:
+    return record.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+def serialise_float(record: float):
+    #--------------------------------------------------------------------------------
+    # NaN marks a missing value, and is not valid JSON.
+    #--------------------------------------------------------------------------------
+    return None if record != record else record
+
+class FrameSerialiser:
+    def __init__(self):
+        """
+        Schema-aware equivalent of serialise_data(), for use in the per-frame hot path.
+
+        Each property is classified once, by the type of its value, rather than by catching
+        an AttributeError on every call. For a Frame, the most recent result is cached, keyed
+        on the frame's tick, so that when several destinations serialise the same frame, the
+        work is done only once per tick. Other dicts (e.g. delta-filtered frames) are not
+        cached. The returned dict is shared between callers, and must not be modified.
+        """
+        self.handlers = {}
+        self.cache = (None, None)
+
+    def get_handler(self, record_type: type):
+        """
+        Returns:
+            The function used to serialise values of the given type, or None if values are
+            passed through unchanged.
+        """
+        try:
+            return self.handlers[record_type]
+        except KeyError:
+            if issubclass(record_type, datetime.datetime):
+                handler = serialise_datetime
+            elif issubclass(record_type, float):
+                handler = serialise_float
+            elif all(hasattr(record_type, name) for name in ("value", "normalised", "change")):
+                handler = serialise_record
+            else:
+                handler = None
+            self.handlers[record_type] = handler
+            return handler
+
+    def serialise(self, data: dict) -> dict:
+        """
+        Serialise the frame, with the same output as serialise_data().
+
+        Args:
+            data (dict): The frame to serialise.
+
+        Returns:
+            dict: The serialised frame.
+        """
+        cached_tick, cached_structure = self.cache
+        tick = getattr(data, "tick", None)
+        if tick is not None and tick == cached_tick:
+            return cached_structure
+
+        handlers = self.handlers
+        structure = {}
+        for name, record in data.items():
+            record_type = type(record)
+            if record_type is float:
+                #--------------------------------------------------------------------------------
+                # The common case, inlined: NaN marks a missing value, and is not valid JSON.
+                #--------------------------------------------------------------------------------
+                structure[name] = record if record == record else None
+                continue
+            handler = handlers[record_type] if record_type in handlers else self.get_handler(record_type)
+            structure[name] = record if handler is None else handler(record)
+
+        #--------------------------------------------------------------------------------
+        # Replace the cache in a single assignment, as destinations may serialise from
+        # worker threads.
+        #--------------------------------------------------------------------------------
+        if tick is not None:
+            self.cache = (tick, structure)
+        return structure
+
+#--------------------------------------------------------------------------------
+# A serialiser shared between all destinations, so that each frame is
+# serialised at most once per tick.
+#--------------------------------------------------------------------------------
+frame_serialiser = FrameSerialiser()
+
 def segment_contiguous(array, min_length:int = 0):
     """
     Given a list of scalar values, segments the list into separate contiguous sequences and returns
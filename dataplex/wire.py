@@ -0,0 +1,209 @@
+#--------------------------------------------------------------------------------
+# Wire encodings for network frames (used by DestinationZMQ and SourceZMQ).
+#
+# Each encoded frame is a list of message parts:
+#  - json:    [json]                          (legacy single-part format)
+#  - msgpack: [b"msgpack", payload]
+#  - struct:  [b"struct", schema_id, values]  where values is a packed float64
+#                                             array of the frame time followed by
+#                                             each property, in schema order
+#             [b"schema", schema_id, json]    sent periodically, mapping a
+#                                             schema_id to its property names
+#             [b"delta", schema_id, indices, values]
+#                                             a partial frame, in delta mode: indices
+#                                             is a packed uint16 array of schema
+#                                             positions, and values is a packed float64
+#                                             array of the frame time followed by each
+#                                             indexed property
+#--------------------------------------------------------------------------------
+
+import json
+import time
+import zlib
+import struct
+import logging
+import datetime
+import numpy as np
+from typing import Optional
+
+try:
+    import msgpack
+except ModuleNotFoundError:
+    msgpack = None
+
+from .utils import frame_serialiser
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS = ["json", "msgpack", "struct"]
+
+#--------------------------------------------------------------------------------
+# Publishers default to JSON, which existing consumers (e.g. those calling
+# recv_json) understand. The msgpack and struct encodings are opt-in, and are
+# only decoded by consumers that read the encoding advertised via Zeroconf.
+#--------------------------------------------------------------------------------
+DEFAULT_ENCODING = "json"
+
+TAG_MSGPACK = b"msgpack"
+TAG_STRUCT = b"struct"
+TAG_SCHEMA = b"schema"
+TAG_DELTA = b"delta"
+
+def is_encoding_available(encoding: str) -> bool:
+    """
+    Returns:
+        bool: True if the given encoding can be used in this environment.
+    """
+    if encoding == "msgpack":
+        return msgpack is not None
+    return encoding in ENCODINGS
+
+def get_timestamp(value) -> float:
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return value
+
+class FrameEncoder:
+    def __init__(self,
+                 encoding: str = DEFAULT_ENCODING,
+                 property_names: Optional[list[str]] = None,
+                 schema_interval: float = 1.0):
+        """
+        Encodes frames for transmission.
+
+        Args:
+            encoding (str, optional): One of "json", "msgpack" or "struct". "msgpack" requires the
+                                      optional msgpack package (pip install "dataplex[msgpack]").
+                                      Defaults to "json".
+            property_names (list[str], optional): For struct encoding, the properties to send, in order.
+                                                  If not specified, taken from the first frame.
+            schema_interval (float, optional): For struct encoding, the interval in seconds between
+                                               schema messages, so that late-joining receivers can
+                                               decode frames. Defaults to 1.0.
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError("Encoding not known: %s (must be one of %s)" % (encoding, ", ".join(ENCODINGS)))
+        if not is_encoding_available(encoding):
+            raise ModuleNotFoundError("Encoding %s requires the %s package" % (encoding, encoding))
+
+        self.encoding = encoding
+        self.schema_interval = schema_interval
+        self.property_names = None
+        self.schema_id = None
+        self.schema_message = None
+        self.last_schema_time = None
+        if property_names is not None:
+            self.set_schema([name for name in property_names if name != "time"])
+
+    def set_schema(self, property_names: list[str]):
+        self.property_names = property_names
+        self.property_indices = dict((name, index) for index, name in enumerate(property_names))
+        schema = json.dumps(property_names).encode()
+        self.schema_id = struct.pack("<I", zlib.crc32(schema))
+        self.schema_message = [TAG_SCHEMA, self.schema_id, schema]
+        self.last_schema_time = None
+
+    def encode(self, data: dict, keyframe: bool = True) -> list[list[bytes]]:
+        """
+        Encode a frame.
+
+        Args:
+            data (dict): The frame to encode.
+            keyframe (bool, optional): If False, data is a partial frame from a DeltaFilter, which is
+                                       sent as a delta message in struct encoding. Defaults to True.
+
+        Returns:
+            list: A list of messages to send, each of which is a list of parts.
+        """
+        if self.encoding == "json":
+            return [[json.dumps(frame_serialiser.serialise(data)).encode()]]
+
+        elif self.encoding == "msgpack":
+            structure = dict((name, get_timestamp(value)) for name, value in data.items())
+            return [[TAG_MSGPACK, msgpack.packb(structure)]]
+
+        else:
+            if self.property_names is None:
+                self.set_schema([name for name in data.keys() if name != "time"])
+
+            messages = []
+            now = time.monotonic()
+            if self.last_schema_time is None or now - self.last_schema_time >= self.schema_interval:
+                messages.append(self.schema_message)
+                self.last_schema_time = now
+
+            if keyframe:
+                values = np.empty(1 + len(self.property_names))
+                values[0] = get_timestamp(data["time"])
+                for index, name in enumerate(self.property_names, 1):
+                    value = data.get(name)
+                    values[index] = np.nan if value is None else value
+                messages.append([TAG_STRUCT, self.schema_id, values.tobytes()])
+            else:
+                indices = [self.property_indices[name] for name in data if name in self.property_indices]
+                values = np.empty(1 + len(indices))
+                values[0] = get_timestamp(data["time"])
+                for index, property_index in enumerate(indices, 1):
+                    value = data[self.property_names[property_index]]
+                    values[index] = np.nan if value is None else value
+                messages.append([TAG_DELTA, self.schema_id,
+                                 np.array(indices, dtype="<u2").tobytes(), values.tobytes()])
+            return messages
+
+class FrameDecoder:
+    def __init__(self):
+        """
+        Decodes frames in any encoding produced by FrameEncoder. Schemas are cached as they
+        are received, so a single decoder should be used per publisher.
+        """
+        self.schemas = {}
+
+    def decode(self, parts: list[bytes]) -> Optional[dict]:
+        """
+        Decode a message.
+
+        Args:
+            parts (list[bytes]): The message parts.
+
+        Returns:
+            dict: The decoded frame, or None if the message carries no frame data
+                  (e.g. a schema message, or a frame whose schema is not yet known).
+        """
+        if len(parts) == 1:
+            return json.loads(parts[0])
+
+        tag = parts[0]
+        if tag == TAG_STRUCT:
+            property_names = self.schemas.get(parts[1])
+            if property_names is None:
+                return None
+            values = np.frombuffer(parts[2], dtype=np.float64).tolist()
+            #--------------------------------------------------------------
+            # Missing values are sent as NaN, and restored to None.
+            #--------------------------------------------------------------
+            data = dict((name, None if value != value else value)
+                        for name, value in zip(property_names, values[1:]))
+            data["time"] = datetime.datetime.fromtimestamp(values[0])
+            return data
+        elif tag == TAG_DELTA:
+            property_names = self.schemas.get(parts[1])
+            if property_names is None:
+                return None
+            indices = np.frombuffer(parts[2], dtype="<u2").tolist()
+            values = np.frombuffer(parts[3], dtype=np.float64).tolist()
+            data = dict((property_names[index], None if value != value else value)
+                        for index, value in zip(indices, values[1:]))
+            data["time"] = datetime.datetime.fromtimestamp(values[0])
+            return data
+        elif tag == TAG_SCHEMA:
+            self.schemas[parts[1]] = json.loads(parts[2])
+            return None
+        elif tag == TAG_MSGPACK:
+            if msgpack is None:
+                raise ModuleNotFoundError("Received msgpack-encoded data, but msgpack is not installed")
+            data = msgpack.unpackb(parts[1])
+            if "time" in data:
+                data["time"] = datetime.datetime.fromtimestamp(data["time"])
+            return data
+        else:
+            raise ValueError("Unknown message encoding: %s" % tag)
@@ -16,8 +16,9 @@ if __name__ == "__main__":
 
     dataplex = Dataplex()
 
-    # TODO: Have the default behaviour be to read as soon as a new frame arrives (if a "push" style source is present)
-    dataplex.config.read_interval = 0.01
+    # Read as soon as a new frame arrives from the OSC source, up to 100Hz
+    dataplex.config.scheduler = "event"
+    dataplex.config.max_rate = 100
     dataplex.add_source(type="osc", port=8000, properties={"/imu/gyro": "vec3"})
     for dim in ["x", "y", "z"]:
         dataplex.add_processor("/imu/gyro_%s" % dim, "normalise", type="linear")
@@ -14,6 +14,9 @@ setup(
     packages = ['dataplex'],
     keywords = ('data', 'analysis', 'statistics', 'sound', 'music'),
     install_requires = ["pydantic==2.8.2", "pyserial", "python-osc", "numpy", "pandas", "jdp", "mido", "signalflow", "pyyaml"],
+    extras_require = {
+        "msgpack": ["msgpack"]
+    },
     classifiers = [
         'Topic :: Multimedia :: Sound/Audio',
         'Topic :: Artistic Software',
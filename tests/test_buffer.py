@@ -0,0 +1,17 @@
+import math
+import datetime
+
+from dataplex.buffer import RollingFeatureBuffer
+
+def test_buffer_non_numeric_values():
+    buffer = RollingFeatureBuffer()
+    now = datetime.datetime.now()
+    buffer.append({"time": now, "a": 1.0, "label": "on", "info": {"x": 1}})
+    buffer.append({"time": now, "a": "abc", "label": "off"})
+    buffer.append({"time": now, "a": [1, 2], "label": None, "info": {"x": 2}})
+
+    assert buffer.a[0] == 1.0
+    assert math.isnan(buffer.a[1]) and math.isnan(buffer.a[2])
+    assert list(buffer.label) == ["on", "off", None]
+    assert list(buffer.info) == [{"x": 1}, None, {"x": 2}]
+    assert buffer[1]["label"] == "off"
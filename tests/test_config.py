@@ -0,0 +1,16 @@
+from dataplex import Dataplex
+
+def test_osc_source_from_config_keeps_property_names(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("\n".join([
+        "sources:",
+        "  - name: osc",
+        "    type: osc",
+        "    port: 9123",
+        "    properties: [a, b]",
+    ]))
+    dataplex = Dataplex(str(config_path))
+    source = dataplex.get_source("osc")
+    assert source.port == 9123
+    assert source.property_names == ["a", "b"]
+    assert dataplex.property_names == ["a", "b"]
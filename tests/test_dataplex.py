@@ -0,0 +1,122 @@
+import math
+import time
+import pytest
+
+from dataplex import Dataplex
+from dataplex.sources import Source
+from dataplex.destinations.csv import DestinationCSV
+from dataplex.destinations.osc import DestinationOSC
+
+class SourcePush (Source):
+    is_push = True
+
+    def __init__(self):
+        super().__init__()
+        self.property_names = ["a"]
+
+    def collect(self):
+        return self.data
+
+def test_stale_null_tick_through_destinations(tmp_path):
+    dataplex = Dataplex()
+    dataplex.config.stale_after = 0.01
+    dataplex.config.stale_policy = "null"
+    source = SourcePush()
+    dataplex.add_source(source, properties={"a": "float"})
+
+    csv_destination = DestinationCSV(["a"], path_template=str(tmp_path / "data.csv"))
+    osc_destination = DestinationOSC("127.0.0.1", 9124, property_names=["a"])
+    dataplex.add_destination(csv_destination)
+    dataplex.add_destination(osc_destination)
+
+    source.publish({"a": 1.0})
+    assert dataplex.next()["a"] == 1.0
+    time.sleep(0.05)
+    data = dataplex.next()
+    assert math.isnan(data["a"])
+    assert data.stale_property_names == frozenset(["a"])
+    osc_destination.send(dict(data, a=None))
+
+    csv_destination.close()
+    with open(csv_destination.path) as fd:
+        rows = fd.read().splitlines()
+    assert rows[1].endswith(",1.000")
+    assert rows[2].endswith(",nan")
+
+def test_stale_null_tick_through_midi_and_json(monkeypatch):
+    import json
+    import mido
+    from dataplex.destinations.midi import DestinationMidi
+    from dataplex.wire import FrameEncoder
+
+    class OutputPort:
+        def __init__(self, name):
+            self.messages = []
+
+        def send(self, message):
+            self.messages.append(message)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(mido, "open_output", OutputPort)
+
+    dataplex = Dataplex()
+    dataplex.config.stale_after = 0.01
+    dataplex.config.stale_policy = "null"
+    source = SourcePush()
+    dataplex.add_source(source, properties={"a": "float"})
+    midi_destination = DestinationMidi("test")
+    midi_destination.add_mapping("a", 1)
+    dataplex.add_destination(midi_destination)
+
+    source.publish({"a": 0.5})
+    dataplex.next()
+    time.sleep(0.05)
+    data = dataplex.next()
+    assert math.isnan(data["a"])
+    assert [message.value for message in midi_destination.output.messages] == [63]
+    midi_destination.close()
+
+    encoded = FrameEncoder("json").encode(data)[0][0]
+    assert json.loads(encoded, parse_constant=lambda constant: pytest.fail("Invalid JSON: %s" % constant))["a"] is None
+
+def test_add_unregistered_sources_keeps_both():
+    dataplex = Dataplex()
+    first = SourcePush()
+    second = SourcePush()
+    dataplex.add_source(first)
+    dataplex.add_source(second)
+    assert dataplex.sources == {"sourcepush": first, "sourcepush_2": second}
+
+def test_process_record_while_push_source_adds_keys():
+    import sys
+    import threading
+
+    #--------------------------------------------------------------
+    # Switch threads as often as possible, to provoke the race.
+    #--------------------------------------------------------------
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    dataplex = Dataplex()
+    source = SourcePush()
+    dataplex.add_source(source, properties={"a": "float"})
+    source.publish({"a": 1.0})
+
+    running = True
+    def publish():
+        index = 0
+        while running:
+            source.publish({"key_%d" % index: 1.0})
+            index += 1
+    thread = threading.Thread(target=publish)
+    thread.start()
+    try:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < 0.5:
+            dataplex.next()
+    finally:
+        running = False
+        thread.join()
+        sys.setswitchinterval(switch_interval)
@@ -0,0 +1,75 @@
+import time
+import datetime
+
+from dataplex.destinations.csv import DestinationCSV
+from dataplex.destinations.npy import DestinationNPY
+
+def test_csv_flushes_on_timer(tmp_path):
+    destination = DestinationCSV(["a"], path_template=str(tmp_path / "data.csv"), flush_interval=0.05)
+    destination.send({"time": datetime.datetime.now(), "a": 1.0})
+    time.sleep(0.2)
+    with open(destination.path) as fd:
+        assert len(fd.read().splitlines()) == 2
+    destination.close()
+
+def test_npy_flushes_partial_row_group(tmp_path):
+    from dataplex.sources.npy import read_npy_log
+
+    destination = DestinationNPY(["a"], path_template=str(tmp_path / "data.npylog"), flush_interval=0.05)
+    start_time = datetime.datetime.now()
+    for index in range(3):
+        destination.send({"time": start_time + datetime.timedelta(seconds=index), "a": float(index)})
+    time.sleep(0.2)
+    destination.send({"time": start_time + datetime.timedelta(seconds=3), "a": 3.0})
+    time.sleep(0.2)
+    assert len(read_npy_log(destination.path)["a"]) == 4
+    destination.close()
+    assert len(read_npy_log(destination.path)["a"]) == 4
+
+def test_queued_destination_sends_events_after_their_frame_on_worker_thread():
+    import threading
+    from dataplex.destinations import Destination, QueuedDestination
+
+    class DestinationSlow (Destination):
+        def __init__(self):
+            self.calls = []
+
+        def send(self, data):
+            time.sleep(0.05)
+            self.calls.append(("send", data["a"], threading.get_ident()))
+
+        def send_events(self, events):
+            self.calls.append(("events", events, threading.get_ident()))
+
+    slow = DestinationSlow()
+    destination = QueuedDestination(slow, policy="block", max_size=4)
+    t0 = time.monotonic()
+    for index in range(3):
+        destination.send({"time": datetime.datetime.now(), "a": index})
+        destination.send_events(["event %d" % index])
+    assert time.monotonic() - t0 < 0.05
+    destination.close()
+
+    assert [call[:2] for call in slow.calls] == [("send", 0), ("events", ["event 0"]),
+                                                 ("send", 1), ("events", ["event 1"]),
+                                                 ("send", 2), ("events", ["event 2"])]
+    assert all(call[2] == destination.thread.ident for call in slow.calls)
+
+def test_osc_skips_non_numeric_values_in_both_modes():
+    from dataplex.destinations.osc import DestinationOSC
+
+    data = {"time": datetime.datetime.now(), "a": 1.0, "b": "abc", "c": None}
+
+    destination = DestinationOSC("127.0.0.1", 9125, property_names=["a", "b", "c"])
+    addresses = []
+    destination.osc_client.send_message = lambda address, args: addresses.append(address)
+    destination.send(data)
+    assert addresses == ["/data/time", "/data/a"]
+
+    destination = DestinationOSC("127.0.0.1", 9125, property_names=["a", "b", "c"], bundle=True)
+    datagrams = []
+    destination.osc_client.send = lambda datagram: datagrams.append(datagram.dgram)
+    destination.send(data)
+    assert len(datagrams) == 1
+    assert b"/data/a" in datagrams[0]
+    assert b"/data/b" not in datagrams[0] and b"/data/c" not in datagrams[0]
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from dataplex.processors import smooth
+from dataplex.processors import ProcessorSmooth
+
+def stream(processor, values):
+    return np.array([np.nan if np.isnan(value) else processor.process(float(value)) for value in values])
+
+@pytest.mark.parametrize("use_lfilter", [True, False])
+def test_smooth_batch_matches_streaming_with_nan(monkeypatch, use_lfilter):
+    if not use_lfilter:
+        monkeypatch.setattr(smooth, "lfilter", False)
+    elif not smooth.get_lfilter():
+        pytest.skip("scipy not available")
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=2000)
+    values[[0, 1, 500, 501, 1999]] = np.nan
+
+    expected = stream(ProcessorSmooth(smoothing=0.9), values)
+    processor = ProcessorSmooth(smoothing=0.9)
+    output = np.concatenate([processor.process_batch(values[:1000]),
+                             processor.process_batch(values[1000:])])
+
+    np.testing.assert_allclose(output, expected, equal_nan=True)
+    assert not np.isnan(processor.value)
+
+def test_smooth_batch_all_nan():
+    processor = ProcessorSmooth(smoothing=0.9)
+    output = processor.process_batch(np.array([np.nan, np.nan]))
+    assert np.isnan(output).all()
+    assert processor.value is None
@@ -0,0 +1,13 @@
+from dataplex.sources.ultimeter import ultimeter
+from dataplex.sources.ultimeter.source import SourceUltimeter
+
+def test_ultimeter_publishes_parsed_messages(monkeypatch):
+    monkeypatch.setattr(ultimeter.Ultimeter, "open", lambda self, port_name=None: None)
+    monkeypatch.setattr(ultimeter.Ultimeter, "start", lambda self: None)
+
+    source = SourceUltimeter(property_names=["wind_speed", "wind_dir"])
+    source.ultimeter.handle(ultimeter.DATA_HEADER + "0010" * len(ultimeter.DATA_PROPERTIES))
+
+    data = source.collect()
+    assert sorted(data.keys()) == ["wind_dir", "wind_speed"]
+    assert source.sequence_numbers == {"wind_speed": 1, "wind_dir": 1}
@@ -0,0 +1,18 @@
+import datetime
+
+from dataplex.frame import Frame
+from dataplex.utils import FrameSerialiser
+
+def test_frame_serialiser_same_time_different_values():
+    serialiser = FrameSerialiser()
+    now = datetime.datetime.now()
+    assert serialiser.serialise({"time": now, "a": 1.0})["a"] == 1.0
+    assert serialiser.serialise({"time": now, "a": 2.0})["a"] == 2.0
+
+    frame = Frame(["a"])
+    frame.update({"time": now, "a": 1.0})
+    frame.next_tick()
+    assert serialiser.serialise(frame)["a"] == 1.0
+    frame.next_tick()
+    frame["a"] = 2.0
+    assert serialiser.serialise(frame)["a"] == 2.0